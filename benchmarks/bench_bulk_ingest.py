@@ -0,0 +1,53 @@
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domains.api_client import JSON_MEDIA_TYPE
+from domains.bulk_ingest import create_executor, decode_units_page
+
+PAGES = 64
+PAGE_SIZE = 500
+
+
+def make_page(page: int) -> bytes:
+    random.seed(page)
+    items = [
+        {
+            'unit_id': page * PAGE_SIZE + i, 'unit_type': 'BM', 'title': f'Unit {page}-{i}',
+            'pv': random.randint(10, 60), 'role': 'Brawler', 'sz': 2, 'mv': '10"/8"j',
+            'short': 3, 'medium': 3, 'long': 1, 'extreme': 0, 'ov': 0, 'armor': 5, 'struc': 4,
+            'threshold': 0, 'specials': 'CASE, IF1, ENE',
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    return json.dumps({'items': items, 'page': page, 'pages': PAGES, 'size': PAGE_SIZE}).encode()
+
+
+def main() -> None:
+    pages = [make_page(page) for page in range(1, PAGES + 1)]
+    args = [(content, JSON_MEDIA_TYPE, page, PAGE_SIZE) for page, content in enumerate(pages, 1)]
+
+    started = time.perf_counter()
+    for arguments in args:
+        decode_units_page(*arguments)
+    serial = time.perf_counter() - started
+    print(f'{PAGES} pages x {PAGE_SIZE} units, serial: {serial * 1000:.0f} ms')
+
+    for kind in ('thread', 'process'):
+        executor = create_executor(kind, os.cpu_count())
+        list(executor.map(decode_units_page, *zip(*args[:os.cpu_count() or 1])))
+
+        started = time.perf_counter()
+        list(executor.map(decode_units_page, *zip(*args)))
+        elapsed = time.perf_counter() - started
+        executor.shutdown()
+        print(f'{kind} pool ({os.cpu_count()} workers): {elapsed * 1000:.0f} ms, x{serial / elapsed:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domains.local_query import apply_filters
+from domains.specials import specials_index
+from domains.unit import Unit
+
+SPECIALS = [
+    'IF1', 'IF2', 'ART-LTC-2', 'CASE', 'CASEII', 'ENE', 'AC2/2/-', 'LRM1/1/1', 'MHQ2',
+    'SRM2/2', 'TAG', 'REAR1/1/-', 'C3M', 'C3S', 'ECM', 'PRB', 'RCN', 'MEL', 'JMPS1',
+    'TUR(2/2/-, IF1)', 'OMNI', 'STL', 'AMS', 'FLK1/1/1', 'HT1/1/-',
+]
+UNITS_COUNT = 20000
+QUERIES = [
+    (['IF'], 'or'),
+    (['CASE', 'ENE'], 'or'),
+    (['ECM', 'TAG'], 'and'),
+    (['ART-LTC', 'IF', 'MHQ'], 'and'),
+]
+
+
+def make_units(count: int) -> list[Unit]:
+    random.seed(0)
+    return [
+        Unit(
+            unit_id=unit_id, unit_type='BM', title=f'Unit {unit_id}', pv=30, role='Brawler', sz=2,
+            mv='10"', short=3, medium=3, long=1, extreme=0, ov=0, armor=5, struc=4, threshold=0,
+            specials=', '.join(random.sample(SPECIALS, random.randint(1, 6)))
+        )
+        for unit_id in range(count)
+    ]
+
+
+def scan(units: list[Unit], terms: list[str], mode: str) -> list[int]:
+    check = all if mode == 'and' else any
+    return [unit.unit_id for unit in units if check(term in unit.specials for term in terms)]
+
+
+def main() -> None:
+    units = make_units(UNITS_COUNT)
+
+    build = timeit.timeit(lambda: specials_index.update(units), number=1)
+    print(f'{UNITS_COUNT} units, {len(specials_index.vocabulary)} terms, index build: {build * 1000:.1f} ms')
+
+    for terms, mode in QUERIES:
+        filters = {'specials': ', '.join(terms), 'specials_mode': mode}
+        found = apply_filters(units, {}, filters)
+        scanned = scan(units, terms, mode)
+        assert sorted(unit.unit_id for unit in found) == scanned
+
+        results = {
+            'string scan': timeit.timeit(lambda: scan(units, terms, mode), number=10) / 10,
+            'apply_filters': timeit.timeit(lambda: apply_filters(units, {}, filters), number=10) / 10,
+        }
+        timings = ', '.join(f'{name} {value * 1000:.2f} ms' for name, value in results.items())
+        print(f'{mode.upper()} {",".join(terms)}: {len(found)} units; {timings}')
+
+if __name__ == '__main__':
+    main()
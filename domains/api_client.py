@@ -1,3 +1,7 @@
+import json
+import os
+import time
+from importlib.util import find_spec
 from typing import TypeVar
 
 import httpx
@@ -6,37 +10,199 @@ from pydantic import TypeAdapter
 from domains.era import Era
 from domains.faction import Faction
 from domains.settings import settings
+from domains.transfer_stats import TransferStats
 from domains.unit import Unit
+from domains.units_page import UnitsPage
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 T = TypeVar("T")
 
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+COLUMNS_MEDIA_TYPE = 'application/vnd.maskirovka.columns+json'
+
+
+def _accept_encoding() -> str:
+    encodings = ['gzip', 'deflate']
+    if find_spec('brotli') or find_spec('brotlicffi'):
+        encodings.insert(0, 'br')
+    if find_spec('zstandard'):
+        encodings.insert(0, 'zstd')
+    return ', '.join(encodings)
+
+
+ACCEPT_ENCODING = _accept_encoding()
+
+
+def rows_from_columns(columns: dict[str, list]) -> list[dict]:
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
+
+
+def response_content_type(response: httpx.Response) -> str:
+    return response.headers.get('content-type', JSON_MEDIA_TYPE).split(';')[0].strip()
+
+
+def decode_body(content: bytes, content_type: str) -> dict | list:
+    if content_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        data = msgpack.unpackb(content)
+    else:
+        data = json.loads(content)
+
+    if isinstance(data, dict) and isinstance(data.get('items'), dict):
+        data['items'] = rows_from_columns(data['items'])
+
+    return data
+
+
+def parse_units_page(data: dict, page: int, page_size: int | None) -> UnitsPage:
+    items = data.get("items", [])
+    units = TypeAdapter(list[Unit]).validate_python(items)
+
+    current_page = data.get("page", page)
+    total_pages = data.get("pages", 1)
+
+    size = data.get("size")
+    if not size:
+        size = len(units) if current_page < total_pages else max(page_size or 0, len(units))
+
+    total = data.get("total")
+    if total is None and current_page >= total_pages:
+        total = (current_page - 1) * size + len(units)
+
+    return UnitsPage(
+        items=units,
+        page=current_page,
+        pages=total_pages,
+        size=max(size, 1),
+        total=total
+    )
+
 
 class ApiError(Exception):
     pass
 
 
+class DaemonTransport(httpx.AsyncBaseTransport):
+    RETRY_DELAY = 30.0
+
+    def __init__(self, api_client: 'ApiClient'):
+        self.api_client = api_client
+        self.daemon = httpx.AsyncHTTPTransport(uds=api_client.daemon_socket)
+        self.direct = httpx.AsyncClient()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.api_client.daemon_available():
+            try:
+                response = await self.daemon.handle_async_request(request)
+            except httpx.TransportError:
+                self.api_client.daemon_retry_at = time.monotonic() + self.RETRY_DELAY
+            else:
+                if response.status_code != httpx.codes.MISDIRECTED_REQUEST:
+                    return response
+                await response.aclose()
+                self.api_client.daemon_retry_at = time.monotonic() + self.RETRY_DELAY
+        return await self.direct.send(request, stream=True)
+
+    async def aclose(self) -> None:
+        await self.daemon.aclose()
+        await self.direct.aclose()
+
+
 class ApiClient:
-    def __init__(self, base_url: str | None = None):
+    def __init__(self, base_url: str | None = None, transport: str | None = None):
         self.base_url = base_url or settings.api_base_url
+        self.transport = transport or settings.api_transport
+        self.daemon_socket = os.path.expanduser(settings.cache_daemon_socket) if settings.cache_daemon_socket else None
+        self.daemon_retry_at = 0.0
+        self.last_transfer: TransferStats | None = None
+        self.total_wire_bytes = 0
+        self.total_body_bytes = 0
+
+    def daemon_available(self) -> bool:
+        return (
+            self.daemon_socket is not None
+            and time.monotonic() >= self.daemon_retry_at
+            and os.path.exists(self.daemon_socket)
+        )
+
+    def create_client(self) -> httpx.AsyncClient:
+        if not self.daemon_available():
+            return httpx.AsyncClient()
+        return httpx.AsyncClient(transport=DaemonTransport(self))
+
+    def _accept(self) -> str:
+        if self.transport == 'msgpack' and msgpack is not None:
+            return f'{MSGPACK_MEDIA_TYPE}, {JSON_MEDIA_TYPE};q=0.5'
+        if self.transport == 'columns':
+            return f'{COLUMNS_MEDIA_TYPE}, {JSON_MEDIA_TYPE};q=0.5'
+        return JSON_MEDIA_TYPE
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        compact: bool = False
+    ) -> httpx.Response:
+        request_headers = {
+            'Accept': self._accept() if compact else JSON_MEDIA_TYPE,
+            'Accept-Encoding': ACCEPT_ENCODING,
+        }
+        if headers:
+            request_headers.update(headers)
+
+        response = await client.get(
+            f"{self.base_url}{endpoint}",
+            params=params,
+            headers=request_headers,
+            timeout=30.0
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return response
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ApiError(f'HTTP {e.response.status_code}: {e.response.text}') from e
+        return response
 
     async def _get(
         self,
         endpoint: str,
         params: dict | None = None,
-        headers: dict | None = None
+        headers: dict | None = None,
+        compact: bool = False
     ) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}{endpoint}",
-                params=params,
-                headers=headers,
-                timeout=30.0
-            )
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                raise ApiError(f'HTTP {e.response.status_code}: {e.response.text}') from e
-            return response.json()
+        async with self.create_client() as client:
+            response = await self._send(client, endpoint, params, headers, compact)
+            return self._decode(endpoint, response)
+
+    def _record(self, endpoint: str, response: httpx.Response, content_type: str, decode_ms: float) -> None:
+        self.last_transfer = TransferStats(
+            endpoint=endpoint,
+            content_type=content_type,
+            content_encoding=response.headers.get('content-encoding'),
+            wire_bytes=response.num_bytes_downloaded,
+            body_bytes=len(response.content),
+            decode_ms=decode_ms,
+            elapsed_ms=response.elapsed.total_seconds() * 1000
+        )
+        self.total_wire_bytes += self.last_transfer.wire_bytes
+        self.total_body_bytes += self.last_transfer.body_bytes
+
+    def _decode(self, endpoint: str, response: httpx.Response) -> dict:
+        started = time.perf_counter()
+
+        content_type = response_content_type(response)
+        data = decode_body(response.content, content_type)
+
+        self._record(endpoint, response, content_type, (time.perf_counter() - started) * 1000)
+        return data
 
     async def _fetch_list(
         self,
@@ -70,9 +236,90 @@ class ApiClient:
         sort_order: str | None = None,
         filters: dict | None = None
     ) -> tuple[list[Unit], int, int]:
+        result = await self.get_units_page(
+            era_id=era_id,
+            faction_ids=faction_ids,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            filters=filters
+        )
+        return result.items, result.page, result.pages
+
+    async def get_units_page(
+        self,
+        era_id: int,
+        faction_ids: list[int],
+        page: int = 1,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        filters: dict | None = None,
+        page_size: int | None = None
+    ) -> UnitsPage:
+        params, headers = self._units_request(era_id, faction_ids, page, sort_by, sort_order, filters, page_size)
+
+        data = await self._get("/units", params=params, headers=headers if headers else None, compact=True)
+
+        return parse_units_page(data, page, page_size)
+
+    async def get_units_raw(
+        self,
+        client: httpx.AsyncClient,
+        era_id: int,
+        faction_ids: list[int],
+        page: int = 1,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        filters: dict | None = None,
+        page_size: int | None = None
+    ) -> tuple[bytes, str]:
+        params, headers = self._units_request(era_id, faction_ids, page, sort_by, sort_order, filters, page_size)
+
+        response = await self._send(client, "/units", params=params, headers=headers if headers else None, compact=True)
+        content_type = response_content_type(response)
+        self._record("/units", response, content_type, 0.0)
+
+        return response.content, content_type
+
+    async def get_units_page_if_changed(
+        self,
+        client: httpx.AsyncClient,
+        era_id: int,
+        faction_ids: list[int],
+        page: int = 1,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        filters: dict | None = None,
+        page_size: int | None = None,
+        etag: str | None = None
+    ) -> tuple[UnitsPage | None, str | None]:
+        params, headers = self._units_request(era_id, faction_ids, page, sort_by, sort_order, filters, page_size)
+        if etag:
+            headers['If-None-Match'] = etag
+
+        response = await self._send(client, "/units", params=params, headers=headers if headers else None, compact=True)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None, etag
+
+        data = self._decode("/units", response)
+        return parse_units_page(data, page, page_size), response.headers.get('etag')
+
+    def _units_request(
+        self,
+        era_id: int,
+        faction_ids: list[int],
+        page: int,
+        sort_by: str | None,
+        sort_order: str | None,
+        filters: dict | None,
+        page_size: int | None
+    ) -> tuple[dict, dict]:
         params: dict = {"era_id": era_id, "page": page}
         headers: dict = {}
 
+        if page_size and settings.page_size_param:
+            params[settings.page_size_param] = page_size
+
         params["faction_id"] = faction_ids
 
         if sort_by is not None:
@@ -100,12 +347,4 @@ class ApiClient:
                     header_name = f'X-{field.capitalize()}-Mode'
                     headers[header_name] = filters[mode_key]
 
-        data = await self._get("/units", params=params, headers=headers if headers else None)
-
-        items = data.get("items", [])
-        units = TypeAdapter(list[Unit]).validate_python(items)
-
-        current_page = data.get("page", page)
-        total_pages = data.get("pages", 1)
-
-        return units, current_page, total_pages
+        return params, headers
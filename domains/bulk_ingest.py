@@ -0,0 +1,134 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+import httpx
+
+from domains.api_client import ApiClient, decode_body, parse_units_page
+from domains.settings import settings
+from domains.unit import Unit
+from domains.units_page import UnitsPage
+from domains.units_cache import UnitsQuery
+
+UNIT_FIELDS = list(Unit.model_fields)
+
+CompactPage = tuple[int, int, int, int | None, list[tuple]]
+
+
+def decode_units_page(content: bytes, content_type: str, page: int, page_size: int | None) -> CompactPage:
+    result = parse_units_page(decode_body(content, content_type), page, page_size)
+    rows = [tuple(getattr(unit, field) for field in UNIT_FIELDS) for unit in result.items]
+    return result.page, result.pages, result.size, result.total, rows
+
+
+def expand_units_page(compact: CompactPage) -> UnitsPage:
+    page, pages, size, total, rows = compact
+    return UnitsPage.model_construct(
+        items=[Unit.model_construct(**dict(zip(UNIT_FIELDS, row))) for row in rows],
+        page=page,
+        pages=pages,
+        size=size,
+        total=total
+    )
+
+
+def create_executor(kind: str | None = None, workers: int | None = None) -> Executor:
+    kind = kind or settings.bulk_executor
+    workers = workers or settings.bulk_workers or os.cpu_count() or 1
+    if kind == 'thread' or sys.__stderr__ is None:
+        return ThreadPoolExecutor(max_workers=workers)
+
+    with contextlib.redirect_stderr(sys.__stderr__):
+        resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+class BulkIngest:
+    def __init__(
+        self,
+        api_client: ApiClient,
+        executor: Executor,
+        in_flight: int | None = None
+    ):
+        self.api_client = api_client
+        self.executor = executor
+        self.in_flight = in_flight or settings.bulk_in_flight
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        query: UnitsQuery,
+        page: int,
+        page_size: int | None
+    ) -> UnitsPage:
+        content, content_type = await self.api_client.get_units_raw(
+            client,
+            era_id=query.era_id,
+            faction_ids=list(query.faction_ids),
+            page=page,
+            sort_by=query.sort_by,
+            sort_order=query.sort_order,
+            filters=query.filters if query.filters else None,
+            page_size=page_size
+        )
+
+        loop = asyncio.get_running_loop()
+        compact = await loop.run_in_executor(
+            self.executor, decode_units_page, content, content_type, page, page_size
+        )
+        return expand_units_page(compact)
+
+    async def run(
+        self,
+        query: UnitsQuery,
+        page_size: int | None,
+        on_page: Callable[[UnitsPage], None],
+        cached: Callable[[int, int], UnitsPage | None] | None = None
+    ) -> list[UnitsPage]:
+        semaphore = asyncio.Semaphore(self.in_flight)
+
+        async with self.api_client.create_client() as client:
+            first = cached(1, page_size) if cached is not None and page_size else None
+            if first is None:
+                first = await self._fetch(client, query, 1, page_size)
+                on_page(first)
+            results = {1: first}
+
+            missing = []
+            for page in range(2, first.pages + 1):
+                result = cached(page, first.size) if cached is not None else None
+                if result is None:
+                    missing.append(page)
+                else:
+                    results[page] = result
+
+            async def load(page: int) -> None:
+                async with semaphore:
+                    result = await self._fetch(client, query, page, first.size)
+                results[page] = result
+                on_page(result)
+
+            tasks = [asyncio.create_task(load(page)) for page in missing]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return [results[page] for page in sorted(results)]
+
+
+def collect_units(pages: list[UnitsPage]) -> list[Unit] | None:
+    first = pages[0]
+    if any(result.pages != first.pages or result.total != first.total for result in pages):
+        return None
+
+    units = [unit for result in pages for unit in result.items]
+    if first.total is not None and len(units) != first.total:
+        return None
+    return units
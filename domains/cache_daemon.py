@@ -0,0 +1,247 @@
+import asyncio
+import contextlib
+import http
+import os
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel
+
+from domains.api_client import ACCEPT_ENCODING
+from domains.settings import settings
+
+STATS_PATH = '/_maskirovka/stats'
+
+
+class CachedResponse(BaseModel):
+    status: int
+    content_type: str = ''
+    etag: str | None = None
+    body: bytes = b''
+    fetched_at: float = 0.0
+
+
+class DaemonStats(BaseModel):
+    requests: int = 0
+    hits: int = 0
+    shared: int = 0
+    upstream: int = 0
+    revalidated: int = 0
+    evicted: int = 0
+    misdirected: int = 0
+    entries: int = 0
+    cached_bytes: int = 0
+
+
+class CacheDaemon:
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        upstream: str | None = None,
+        memory_budget: int | None = None,
+        ttl: float | None = None
+    ):
+        self.socket_path = Path(socket_path or settings.cache_daemon_socket).expanduser()
+        self.upstream = httpx.URL(upstream or settings.api_base_url)
+        self.origin = f'{self.upstream.scheme}://{self.upstream.netloc.decode("ascii")}'
+        self.memory_budget = memory_budget or settings.cache_daemon_memory_mb * 1024 * 1024
+        self.ttl = settings.cache_daemon_ttl if ttl is None else ttl
+        self.stats = DaemonStats()
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    async def serve(self) -> None:
+        if await self._is_running():
+            raise RuntimeError(f'Демон кэша уже запущен: {self.socket_path}')
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+        async with httpx.AsyncClient() as client:
+            self._client = client
+            server = await asyncio.start_unix_server(self._handle_connection, path=str(self.socket_path))
+            os.chmod(self.socket_path, 0o666)
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                with contextlib.suppress(FileNotFoundError):
+                    self.socket_path.unlink()
+
+    async def _is_running(self) -> bool:
+        try:
+            _, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                method, target, _ = request_line.split(' ', 2)
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(':')
+                        headers[name.strip().lower()] = value.strip()
+
+                response = await self._respond(method, target, headers)
+                writer.write(self._serialize(response, headers.get('if-none-match')))
+                await writer.drain()
+
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _serialize(self, response: CachedResponse, if_none_match: str | None) -> bytes:
+        status, body = response.status, response.body
+        if status == 200 and response.etag and if_none_match == response.etag:
+            status, body = 304, b''
+
+        try:
+            reason = http.HTTPStatus(status).phrase
+        except ValueError:
+            reason = ''
+
+        lines = [f'HTTP/1.1 {status} {reason}']
+        if response.content_type:
+            lines.append(f'Content-Type: {response.content_type}')
+        if response.etag:
+            lines.append(f'ETag: {response.etag}')
+        if status != 304:
+            lines.append(f'Content-Length: {len(body)}')
+        lines.append('Connection: keep-alive')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    async def _respond(self, method: str, target: str, headers: dict[str, str]) -> CachedResponse:
+        if method != 'GET':
+            return CachedResponse(status=405)
+        if target == STATS_PATH:
+            return CachedResponse(status=200, content_type='application/json', body=self.stats.model_dump_json().encode())
+
+        if not self._serves(headers.get('host', '')):
+            self.stats.misdirected += 1
+            return CachedResponse(
+                status=421,
+                content_type='text/plain',
+                body=f'Демон кэша обслуживает {self.origin}'.encode()
+            )
+
+        self.stats.requests += 1
+        forwarded = {
+            name: value for name, value in headers.items()
+            if name == 'accept' or name.startswith('x-')
+        }
+        key = (self.origin, target, tuple(sorted(forwarded.items())))
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.ttl:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats.shared += 1
+        else:
+            task = asyncio.create_task(self._fetch(key, target, forwarded, entry))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def _serves(self, host: str) -> bool:
+        try:
+            requested = httpx.URL(f'{self.upstream.scheme}://{host}/')
+        except httpx.InvalidURL:
+            return False
+        return (requested.host, requested.port) == (self.upstream.host, self.upstream.port)
+
+    async def _fetch(
+        self,
+        key: tuple,
+        target: str,
+        headers: dict[str, str],
+        stale: CachedResponse | None
+    ) -> CachedResponse:
+        request_headers = dict(headers, **{'accept-encoding': ACCEPT_ENCODING})
+        if stale is not None and stale.etag:
+            request_headers['if-none-match'] = stale.etag
+
+        self.stats.upstream += 1
+        try:
+            response = await self._client.get(
+                self.upstream.copy_with(raw_path=target.encode('latin-1')),
+                headers=request_headers,
+                timeout=30.0
+            )
+        except httpx.HTTPError as e:
+            return CachedResponse(status=502, content_type='text/plain', body=str(e).encode())
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            self.stats.revalidated += 1
+            stale.fetched_at = time.monotonic()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._store(key, stale)
+            return stale
+
+        result = CachedResponse(
+            status=response.status_code,
+            content_type=response.headers.get('content-type', ''),
+            etag=response.headers.get('etag'),
+            body=response.content,
+            fetched_at=time.monotonic()
+        )
+        if result.status == 200:
+            self._store(key, result)
+        return result
+
+    def _store(self, key: tuple, result: CachedResponse) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.stats.cached_bytes -= len(previous.body)
+
+        if len(result.body) > self.memory_budget:
+            self.stats.entries = len(self._entries)
+            return
+
+        self._entries[key] = result
+        self.stats.cached_bytes += len(result.body)
+        while self.stats.cached_bytes > self.memory_budget:
+            _, evicted = self._entries.popitem(last=False)
+            self.stats.cached_bytes -= len(evicted.body)
+            self.stats.evicted += 1
+        self.stats.entries = len(self._entries)
+
+
+def main() -> None:
+    daemon = CacheDaemon()
+    print(f'Демон кэша: {daemon.socket_path} -> {daemon.upstream}', file=sys.stderr)
+    try:
+        asyncio.run(daemon.serve())
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+import asyncio
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import logging.handlers
+import pstats
+import sys
+import threading
+import time
+import traceback
+import types
+from pathlib import Path
+
+from domains.settings import settings
+
+logger = logging.getLogger('maskirovka.diagnostics')
+
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+_running: list[str] = []
+_logger_lock = threading.Lock()
+
+
+def _logger() -> logging.Logger:
+    if logger.handlers:
+        return logger
+
+    with _logger_lock:
+        if logger.handlers:
+            return logger
+        path = Path(settings.diagnostics_log).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8'
+        )
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+    return logger
+
+
+def _budget(budget_ms: float | None) -> float:
+    return settings.frame_budget_ms if budget_ms is None else budget_ms
+
+
+def report_slow(name: str, elapsed_ms: float, budget_ms: float) -> None:
+    _logger().warning('%s took %.1f ms (budget %.1f ms)', name, elapsed_ms, budget_ms)
+
+
+@types.coroutine
+def _measure_steps(coroutine, name: str, budget_ms: float):
+    slowest = 0.0
+    value = None
+    error: BaseException | None = None
+
+    while True:
+        started = time.perf_counter()
+        _running.append(name)
+        try:
+            if error is None:
+                awaited = coroutine.send(value)
+            else:
+                awaited = coroutine.throw(error)
+        except StopIteration as stop:
+            _running.pop()
+            slowest = max(slowest, (time.perf_counter() - started) * 1000)
+            if slowest > budget_ms:
+                report_slow(name, slowest, budget_ms)
+            return stop.value
+        except BaseException:
+            _running.pop()
+            raise
+        _running.pop()
+        slowest = max(slowest, (time.perf_counter() - started) * 1000)
+
+        try:
+            value = yield awaited
+            error = None
+        except BaseException as e:
+            value = None
+            error = e
+
+
+def timed(func=None, *, budget_ms: float | None = None):
+    def decorate(method):
+        name = method.__qualname__
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            def async_wrapper(*args, **kwargs):
+                return _measure_steps(method(*args, **kwargs), name, _budget(budget_ms))
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            _running.append(name)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                _running.pop()
+                elapsed = (time.perf_counter() - started) * 1000
+                if elapsed > _budget(budget_ms):
+                    report_slow(name, elapsed, _budget(budget_ms))
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def instrument(cls):
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith(('on_', 'action_')) and inspect.isfunction(value):
+            setattr(cls, attribute, timed(value))
+    return cls
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.1, budget_ms: float | None = None):
+        self.interval = interval
+        self.budget_ms = _budget(budget_ms)
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._beat = time.perf_counter()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        _logger()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        threading.Thread(target=self._watch, name='loop-lag-watchdog', daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self._beat = now
+            self.last_lag_ms = max((now - expected) * 1000, 0.0)
+            self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+            if self.last_lag_ms > self.budget_ms:
+                _logger().warning('event loop lag %.1f ms', self.last_lag_ms)
+
+    def _watch(self) -> None:
+        reported_beat = 0.0
+        while not self._stopped.wait(self.budget_ms / 1000):
+            beat = self._beat
+            stalled_ms = (time.perf_counter() - beat) * 1000 - self.interval * 1000
+            if stalled_ms <= self.budget_ms or beat == reported_beat:
+                continue
+
+            reported_beat = beat
+            handlers = ' > '.join(_running) or 'no instrumented handler'
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                stack = ''.join(traceback.format_stack(frame, limit=12))
+                _logger().warning(
+                    'event loop blocked for %.1f ms in %s, loop thread stack:\n%s', stalled_ms, handlers, stack
+                )
+
+
+class ProfileCapture:
+    def __init__(self):
+        self._profile: cProfile.Profile | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def start(self) -> None:
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> Path | None:
+        if self._profile is None:
+            return None
+
+        self._profile.disable()
+        profile, self._profile = self._profile, None
+
+        path = Path(settings.profile_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        path = path / f'maskirovka_{time.strftime("%Y%m%d_%H%M%S")}.prof'
+        profile.dump_stats(path)
+
+        summary = io.StringIO()
+        pstats.Stats(profile, stream=summary).sort_stats('cumulative').print_stats(25)
+        _logger().info('profile saved to %s\n%s', path, summary.getvalue())
+
+        return path
+
+    def toggle(self) -> Path | None:
+        if self.active:
+            return self.stop()
+        self.start()
+        return None
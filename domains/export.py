@@ -0,0 +1,21 @@
+import csv
+import time
+from pathlib import Path
+
+from domains.settings import settings
+from domains.unit import Unit
+
+
+def export_units_csv(units: list[Unit], directory: str | None = None) -> Path:
+    path = Path(directory or settings.export_dir).expanduser()
+    path.mkdir(parents=True, exist_ok=True)
+    path = path / f'maskirovka_export_{time.strftime("%Y%m%d_%H%M%S")}.csv'
+
+    fields = list(Unit.model_fields)
+    with path.open('w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(fields)
+        for unit in units:
+            writer.writerow([getattr(unit, field) for field in fields])
+
+    return path
\ No newline at end of file
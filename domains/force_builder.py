@@ -0,0 +1,221 @@
+import heapq
+import time
+from collections.abc import Callable, Iterator
+
+from pydantic import BaseModel
+
+from domains.unit import Unit
+
+MAX_BOUND_CELLS = 250_000
+
+SCORES: dict[str, tuple[str, Callable[[Unit], int]]] = {
+    'damage': ('Урон (ближняя + средняя + дальняя)', lambda unit: unit.short + unit.medium + unit.long),
+    'durability': ('Живучесть (броня + структура)', lambda unit: unit.armor + unit.struc),
+    'balanced': ('Урон + живучесть', lambda unit: unit.short + unit.medium + unit.long + unit.armor + unit.struc),
+    'pv': ('Стоимость (PV)', lambda unit: unit.pv),
+}
+
+
+class _SearchStopped(Exception):
+    pass
+
+
+class ForceList(BaseModel):
+    score: int
+    pv: int
+    units: list[Unit]
+
+
+class ForceBuilder:
+    def __init__(
+        self,
+        units: list[Unit],
+        budget: int,
+        min_count: int = 1,
+        max_count: int = 4,
+        score: str = 'damage',
+        roles: set[str] | None = None,
+        unit_types: set[str] | None = None,
+        top: int = 5
+    ):
+        self.budget = budget
+        self.min_count = max(min_count, 1)
+        self.max_count = max(max_count, self.min_count)
+        self.score = SCORES[score][1]
+        self.top = top
+        self.candidates = self._prepare(units, roles, unit_types)
+        self.finished = False
+        self.elapsed = 0.0
+
+    def _prepare(self, units: list[Unit], roles: set[str] | None, unit_types: set[str] | None) -> list[Unit]:
+        unique = {unit.unit_id: unit for unit in units}.values()
+        allowed = [
+            unit for unit in unique
+            if 0 < unit.pv <= self.budget
+            and (not roles or unit.role in roles)
+            and (not unit_types or unit.unit_type in unit_types)
+        ]
+
+        keep = self.max_count + self.top
+        cheaper_scores: list[int] = []
+        candidates: list[Unit] = []
+        for unit in sorted(allowed, key=lambda unit: (unit.pv, -self.score(unit))):
+            score = self.score(unit)
+            if len(cheaper_scores) >= keep and cheaper_scores[0] >= score:
+                continue
+
+            candidates.append(unit)
+            if len(cheaper_scores) >= keep:
+                heapq.heapreplace(cheaper_scores, score)
+            else:
+                heapq.heappush(cheaper_scores, score)
+
+        return sorted(candidates, key=lambda unit: (-self.score(unit), unit.pv))
+
+    def _greedy(self, scores: list[int], costs: list[int]) -> tuple[int, ...] | None:
+        cheapest = sorted(costs)
+        chosen: list[int] = []
+        budget = self.budget
+
+        for i in range(len(costs)):
+            if len(chosen) == self.max_count:
+                break
+            needed = max(self.min_count - len(chosen) - 1, 0)
+            if costs[i] + sum(cheapest[:needed]) <= budget:
+                chosen.append(i)
+                budget -= costs[i]
+
+        for i in sorted(range(len(costs)), key=costs.__getitem__):
+            if len(chosen) >= self.min_count:
+                break
+            if i not in chosen and costs[i] <= budget:
+                chosen.append(i)
+                budget -= costs[i]
+
+        return tuple(sorted(chosen)) if len(chosen) >= self.min_count else None
+
+    def _suffix_bounds(
+        self,
+        scores: list[int],
+        costs: list[int],
+        step: int,
+        deadline: float
+    ) -> list[list[list[int]]]:
+        budget = self.budget // step
+        costs = [cost // step for cost in costs]
+        zero = [0] * (budget + 1)
+        bounds: list[list[list[int]]] = [[zero] * (self.max_count + 1)]
+
+        for i in range(len(scores) - 1, -1, -1):
+            if time.perf_counter() > deadline:
+                raise _SearchStopped
+
+            following = bounds[-1]
+            cost, score = costs[i], scores[i]
+            rows = [zero]
+            for slots in range(1, self.max_count + 1):
+                keep, take = following[slots], following[slots - 1]
+                rows.append(keep[:cost] + [max(a, b + score) for a, b in zip(keep[cost:], take)])
+            bounds.append(rows)
+
+        bounds.reverse()
+        return bounds
+
+    def search(
+        self,
+        time_limit: float = 0.5,
+        should_stop: Callable[[], bool] | None = None
+    ) -> Iterator[list[ForceList]]:
+        started = time.perf_counter()
+        self.finished = False
+        self.elapsed = 0.0
+
+        items = self.candidates
+        count = len(items)
+        if count < self.min_count:
+            self.finished = True
+            return
+
+        scores = [self.score(unit) for unit in items]
+        costs = [unit.pv for unit in items]
+        step = -(-count * self.max_count * (self.budget + 1) // MAX_BOUND_CELLS)
+
+        min_cost = [0] * (count + 1)
+        min_cost[count] = self.budget + 1
+        for i in range(count - 1, -1, -1):
+            min_cost[i] = min(min_cost[i + 1], costs[i])
+
+        results: list[tuple[int, int, tuple[int, ...]]] = []
+        deadline = started + time_limit
+        chosen: list[int] = []
+        nodes = 0
+        best_score = -1
+        seed = self._greedy(scores, costs)
+        if seed is not None:
+            best_score = sum(scores[i] for i in seed)
+            results.append((best_score, -sum(costs[i] for i in seed), seed))
+
+        def threshold() -> int:
+            return results[0][0] if len(results) >= self.top else -1
+
+        def visit(start: int, budget: int, score: int) -> Iterator[None]:
+            nonlocal nodes, best_score
+
+            if len(chosen) >= self.min_count and score > threshold() and tuple(chosen) != seed:
+                entry = (score, -(self.budget - budget), tuple(chosen))
+                if len(results) >= self.top:
+                    heapq.heapreplace(results, entry)
+                else:
+                    heapq.heappush(results, entry)
+                if score > best_score:
+                    best_score = score
+                    yield
+
+            slots = self.max_count - len(chosen)
+            if slots == 0:
+                return
+
+            for i in range(start, count):
+                nodes += 1
+                if nodes % 1024 == 0 and (
+                    time.perf_counter() > deadline or (should_stop is not None and should_stop())
+                ):
+                    raise _SearchStopped
+
+                if min_cost[i] > budget:
+                    return
+
+                if score + bounds[i][slots][budget // step] <= threshold():
+                    return
+
+                if costs[i] > budget:
+                    continue
+
+                chosen.append(i)
+                yield from visit(i + 1, budget - costs[i], score + scores[i])
+                chosen.pop()
+
+        try:
+            if results:
+                yield self._materialize(results)
+            bounds = self._suffix_bounds(scores, costs, step, deadline)
+            for _ in visit(0, self.budget, 0):
+                yield self._materialize(results)
+            self.finished = True
+        except _SearchStopped:
+            pass
+        finally:
+            self.elapsed = time.perf_counter() - started
+
+        if results:
+            yield self._materialize(results)
+
+    def _materialize(self, results: list[tuple[int, int, tuple[int, ...]]]) -> list[ForceList]:
+        return [
+            ForceList(
+                score=score,
+                pv=-negative_pv,
+                units=[self.candidates[i] for i in indexes]
+            )
+            for score, negative_pv, indexes in sorted(results, reverse=True)
+        ]
@@ -0,0 +1,121 @@
+import bisect
+import heapq
+from collections import Counter, defaultdict
+from typing import Any
+
+
+def trigrams(text: str, complete: bool = True) -> set[str]:
+    grams: set[str] = set()
+    words = text.lower().split()
+
+    for index, word in enumerate(words):
+        padded = f'  {word} ' if complete or index < len(words) - 1 else f'  {word}'
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return grams
+
+
+class FuzzyIndex:
+    def __init__(self):
+        self._entries: dict[str, tuple[str, Any]] = {}
+        self._lowered: dict[str, str] = {}
+        self._lengths: dict[str, int] = {}
+        self._grams: dict[str, set[str]] = defaultdict(set)
+        self._sorted: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def add(self, key: str, title: str, payload: Any = None) -> None:
+        current = self._entries.get(key)
+        if current is not None and current[0] == title:
+            self._entries[key] = (title, payload)
+            return
+
+        if current is not None:
+            self.remove(key)
+
+        self._entries[key] = (title, payload)
+        self._lowered[key] = title.lower()
+        self._lengths[key] = len(title)
+        bisect.insort(self._sorted, (self._lowered[key], key))
+        for gram in trigrams(title):
+            self._grams[gram].add(key)
+
+    def remove(self, key: str) -> None:
+        current = self._entries.pop(key, None)
+        if current is None:
+            return
+        lowered = self._lowered.pop(key)
+        del self._lengths[key]
+        del self._sorted[bisect.bisect_left(self._sorted, (lowered, key))]
+
+        for gram in trigrams(current[0]):
+            keys = self._grams.get(gram)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._grams[gram]
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def _prefixed(self, query: str) -> list[str]:
+        start = bisect.bisect_left(self._sorted, (query,))
+        end = bisect.bisect_left(self._sorted, (query + '\U0010ffff',), start)
+        return [key for _, key in self._sorted[start:end]]
+
+    def search(self, text: str, limit: int = 20) -> list[tuple[str, str, Any]]:
+        query = text.strip().lower()
+        grams = trigrams(query, complete=False)
+        if not grams:
+            return []
+
+        lowered = self._lowered
+        postings = sorted((self._grams.get(gram, set()) for gram in grams), key=len)
+        exact = set.intersection(*postings) if postings[0] else set()
+
+        if len(exact) >= limit:
+            if len(query) < 3:
+                prefixed = self._prefixed(query)
+            else:
+                prefixed = [key for key in exact if lowered[key].startswith(query)]
+            best = heapq.nsmallest(limit, prefixed, key=self._lengths.get)
+            if len(best) < limit:
+                rest = exact.difference(prefixed)
+                best += heapq.nsmallest(limit - len(best), rest, key=self._lengths.get)
+            return [(key, *self._entries[key]) for key in best]
+
+        # A key with c hits is in one of the len(grams) - c + 1 rarest postings, so stop
+        # once every key within one hit of the best so far must have been seen.
+        hits: Counter[str] = Counter()
+        best_hits = 0
+        for used, keys in enumerate(postings, 1):
+            fresh = keys.difference(hits)
+            for other in postings:
+                hits.update(fresh.intersection(other))
+            best_hits = max(best_hits, max((hits[key] for key in fresh), default=0))
+            if best_hits and used >= len(grams) - best_hits + 2:
+                break
+        if not hits:
+            return []
+
+        threshold = best_hits - 1
+
+        def score(key: str) -> tuple[float, int]:
+            title = lowered[key]
+            value = hits[key] / len(grams)
+            if title.startswith(query):
+                value += 1.0
+            elif query in title:
+                value += 0.5
+            return value, -len(title)
+
+        candidates = [key for key, count in hits.items() if count >= threshold]
+        best = heapq.nlargest(limit, candidates, key=score)
+        return [(key, *self._entries[key]) for key in best]
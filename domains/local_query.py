@@ -0,0 +1,131 @@
+import math
+import re
+
+from domains.specials import specials_index
+from domains.unit import Unit
+
+NUMERIC_FIELDS = ['pv', 'sz', 'short', 'medium', 'long', 'extreme', 'ov', 'armor', 'struc', 'threshold']
+TEXT_FIELDS = ['unit_type', 'role']
+
+_MV_NUMBER = re.compile(r'\d+')
+
+
+def mv_key(mv: str) -> tuple:
+    return tuple(int(number) for number in _MV_NUMBER.findall(mv)), mv
+
+
+def sort_key(field: str):
+    if field == 'mv':
+        return lambda unit: mv_key(unit.mv)
+    if field in ('title', 'role', 'unit_type', 'specials'):
+        return lambda unit: getattr(unit, field).lower()
+    return lambda unit: getattr(unit, field)
+
+
+def sort_units(units: list[Unit], keys: list[tuple[str, str]]) -> list[Unit]:
+    result = list(units)
+    for field, order in reversed(keys):
+        result.sort(key=sort_key(field), reverse=order == 'desc')
+    return result
+
+
+def _interval(value: int, mode: str) -> tuple[float, float]:
+    match mode:
+        case 'gt':
+            return value + 1, math.inf
+        case 'gte':
+            return value, math.inf
+        case 'lt':
+            return -math.inf, value - 1
+        case 'lte':
+            return -math.inf, value
+        case _:
+            return value, value
+
+
+def _specials_terms(value: str) -> set[str]:
+    return {term.strip().lower() for term in value.split(',') if term.strip()}
+
+
+def narrows(base: dict, filters: dict) -> bool:
+    for key, value in base.items():
+        if key.endswith('_mode'):
+            continue
+
+        if key not in filters:
+            return False
+
+        if key == 'title':
+            if str(value).lower() not in str(filters[key]).lower():
+                return False
+        elif key == 'specials':
+            if base.get('specials_mode', 'or') != filters.get('specials_mode', 'or'):
+                return False
+            old_terms, new_terms = _specials_terms(value), _specials_terms(filters[key])
+            if filters.get('specials_mode', 'or') == 'and':
+                if not new_terms >= old_terms:
+                    return False
+            elif not new_terms <= old_terms:
+                return False
+        elif key in NUMERIC_FIELDS:
+            old_low, old_high = _interval(value, base.get(f'{key}_mode', 'eq'))
+            new_low, new_high = _interval(filters[key], filters.get(f'{key}_mode', 'eq'))
+            if new_low < old_low or new_high > old_high:
+                return False
+        elif filters[key] != value or filters.get(f'{key}_mode') != base.get(f'{key}_mode'):
+            return False
+
+    return all(_locally_applicable(key) for key in changed_filters(base, filters))
+
+
+def changed_filters(base: dict, filters: dict) -> list[str]:
+    return [
+        key for key, value in filters.items()
+        if not key.endswith('_mode')
+        and (base.get(key) != value or base.get(f'{key}_mode') != filters.get(f'{key}_mode'))
+    ]
+
+
+def _locally_applicable(key: str) -> bool:
+    return key in ('title', 'specials') or key in NUMERIC_FIELDS or key in TEXT_FIELDS
+
+
+def specials_matches(units: list[Unit], filters: dict) -> set[int]:
+    return specials_index.matching(units, list(_specials_terms(filters['specials'])), filters.get('specials_mode', 'or'))
+
+
+def matches(unit: Unit, filters: dict, keys: list[str], specials_ids: set[int] | None = None) -> bool:
+    for key in keys:
+        value = filters[key]
+
+        if key == 'title':
+            if str(value).lower() not in unit.title.lower():
+                return False
+        elif key == 'specials':
+            if specials_ids is None:
+                specials_ids = specials_matches([unit], filters)
+            if unit.unit_id not in specials_ids:
+                return False
+        elif key in NUMERIC_FIELDS:
+            low, high = _interval(value, filters.get(f'{key}_mode', 'eq'))
+            if not low <= getattr(unit, key) <= high:
+                return False
+        elif getattr(unit, key) != value:
+            return False
+
+    return True
+
+
+def apply_filters(units: list[Unit], base: dict, filters: dict) -> list[Unit]:
+    keys = changed_filters(base, filters)
+    if not keys:
+        return list(units)
+
+    if 'specials' in keys:
+        specials_ids = specials_matches(units, filters)
+        units = [unit for unit in units if unit.unit_id in specials_ids]
+        keys = [key for key in keys if key != 'specials']
+        if not keys:
+            return units
+
+    return [unit for unit in units if matches(unit, filters, keys)]
@@ -0,0 +1,42 @@
+from domains.transfer_stats import TransferStats
+
+
+class PageSizer:
+    def __init__(
+        self,
+        min_size: int = 10,
+        max_size: int = 100,
+        target_ms: float = 300.0,
+        smoothing: float = 0.3
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_ms = target_ms
+        self.smoothing = smoothing
+        self.visible_rows = min_size
+        self.bytes_per_ms: float | None = None
+        self.bytes_per_row: float | None = None
+
+    def _smooth(self, current: float | None, value: float) -> float:
+        if current is None:
+            return value
+        return current + self.smoothing * (value - current)
+
+    def observe(self, transfer: TransferStats, rows: int) -> None:
+        if rows <= 0 or transfer.elapsed_ms <= 0:
+            return
+
+        self.bytes_per_ms = self._smooth(self.bytes_per_ms, transfer.wire_bytes / transfer.elapsed_ms)
+        self.bytes_per_row = self._smooth(self.bytes_per_row, transfer.wire_bytes / rows)
+
+    def choose(self) -> int:
+        visible = max(self.visible_rows, self.min_size)
+        if self.bytes_per_ms is None or not self.bytes_per_row:
+            return min(visible, self.max_size)
+
+        affordable = int(self.target_ms * self.bytes_per_ms / self.bytes_per_row)
+        if affordable <= visible:
+            return min(visible, self.max_size)
+
+        screens = affordable // visible
+        return min(visible * screens, self.max_size)
\ No newline at end of file
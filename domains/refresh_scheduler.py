@@ -0,0 +1,181 @@
+import asyncio
+import random
+import time
+from collections.abc import Callable
+
+import httpx
+
+from domains.api_client import ApiClient, ApiError
+from domains.saved_queries import PageFingerprint, QueryChanges, SavedQuery, diff_units, page_digest
+from domains.settings import settings
+from domains.unit import Unit
+from domains.units_cache import UnitsCache, UnitsQuery
+from domains.units_page import UnitsPage
+
+
+class RefreshScheduler:
+    def __init__(
+        self,
+        api_client: ApiClient,
+        units_cache: UnitsCache,
+        interval: float | None = None,
+        jitter: float | None = None,
+        concurrency: int | None = None
+    ):
+        self.api_client = api_client
+        self.units_cache = units_cache
+        self.interval = interval or settings.refresh_interval
+        self.jitter = settings.refresh_jitter if jitter is None else jitter
+        self.concurrency = concurrency or settings.refresh_concurrency
+        self._next_run: dict[str, float] = {}
+        self._running: set[str] = set()
+        self._wakeup = asyncio.Event()
+
+    def next_run(self, saved: SavedQuery) -> float:
+        if saved.name not in self._next_run:
+            if not saved.refreshed_at:
+                self._next_run[saved.name] = 0.0
+            else:
+                self._next_run[saved.name] = saved.refreshed_at + self._spread()
+        return self._next_run[saved.name]
+
+    def _spread(self) -> float:
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def forget(self, name: str) -> None:
+        self._next_run.pop(name, None)
+        self.wake()
+
+    async def run(
+        self,
+        queries: Callable[[], list[SavedQuery]],
+        on_refreshed: Callable[[SavedQuery, QueryChanges | None], None],
+        on_page: Callable[[UnitsQuery, UnitsPage], None] | None = None
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        async with self.api_client.create_client() as client:
+            try:
+                while True:
+                    now = time.time()
+                    waiting = [saved for saved in queries() if saved.name not in self._running]
+
+                    for saved in waiting:
+                        if self.next_run(saved) <= now:
+                            self._running.add(saved.name)
+                            task = asyncio.create_task(
+                                self._refresh_and_report(client, semaphore, saved, on_refreshed, on_page)
+                            )
+                            tasks.add(task)
+                            task.add_done_callback(tasks.discard)
+
+                    upcoming = [self.next_run(saved) for saved in waiting if saved.name not in self._running]
+                    delay = min(upcoming, default=now + self.interval) - now
+
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 1.0))
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _refresh_and_report(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        saved: SavedQuery,
+        on_refreshed: Callable[[SavedQuery, QueryChanges | None], None],
+        on_page: Callable[[UnitsQuery, UnitsPage], None] | None
+    ) -> None:
+        try:
+            on_refreshed(saved, await self.refresh(client, semaphore, saved, on_page))
+        except (ApiError, httpx.HTTPError):
+            pass
+        finally:
+            self._running.discard(saved.name)
+            self._next_run[saved.name] = time.time() + self._spread()
+            self.wake()
+
+    async def refresh(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        saved: SavedQuery,
+        on_page: Callable[[UnitsQuery, UnitsPage], None] | None = None
+    ) -> QueryChanges | None:
+        query = saved.query()
+        baseline = not saved.pages
+        fingerprints: list[PageFingerprint] = []
+        loaded: dict[int, list[Unit]] = {}
+
+        page = 1
+        pages = max(len(saved.pages), 1)
+        while page <= pages:
+            known = saved.pages[page - 1] if page <= len(saved.pages) else None
+            async with semaphore:
+                result, etag = await self.api_client.get_units_page_if_changed(
+                    client,
+                    era_id=query.era_id,
+                    faction_ids=list(query.faction_ids),
+                    page=page,
+                    sort_by=query.sort_by,
+                    sort_order=query.sort_order,
+                    filters=query.filters if query.filters else None,
+                    page_size=saved.page_size or None,
+                    etag=known.etag if known else None
+                )
+
+            if result is None:
+                fingerprints.append(known)
+            else:
+                pages = result.pages
+                saved.page_size = saved.page_size or result.size
+                loaded[page] = result.items
+                fingerprints.append(PageFingerprint(digest=page_digest(result.items), etag=etag))
+                if on_page is not None:
+                    on_page(query, result)
+            page += 1
+
+        changed = [f.digest for f in fingerprints] != [f.digest for f in saved.pages]
+        saved.pages = fingerprints
+        saved.refreshed_at = time.time()
+        if not changed:
+            return None
+
+        for page in range(1, len(fingerprints) + 1):
+            if page not in loaded:
+                loaded[page] = await self._load_page(client, semaphore, saved, query, page)
+
+        changes, saved.units = diff_units(saved.units, [unit for page in sorted(loaded) for unit in loaded[page]])
+        return None if baseline else changes
+
+    async def _load_page(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        saved: SavedQuery,
+        query: UnitsQuery,
+        page: int
+    ) -> list[Unit]:
+        cached = self.units_cache.get_page(query, page, saved.page_size)
+        if cached is not None:
+            return cached[0]
+
+        async with semaphore:
+            result, _ = await self.api_client.get_units_page_if_changed(
+                client,
+                era_id=query.era_id,
+                faction_ids=list(query.faction_ids),
+                page=page,
+                sort_by=query.sort_by,
+                sort_order=query.sort_order,
+                filters=query.filters if query.filters else None,
+                page_size=saved.page_size
+            )
+        return result.items
@@ -0,0 +1,97 @@
+import hashlib
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from domains.settings import settings
+from domains.unit import Unit
+from domains.units_cache import UnitsQuery
+
+
+class PageFingerprint(BaseModel):
+    digest: str
+    etag: str | None = None
+
+
+class QueryChanges(BaseModel):
+    added: list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+class SavedQuery(BaseModel):
+    name: str
+    era_id: int
+    faction_ids: list[int]
+    sort_by: str = 'title'
+    sort_order: str = 'asc'
+    filters: dict = {}
+    page_size: int = 0
+    pages: list[PageFingerprint] = []
+    units: dict[int, tuple[str, str]] = {}
+    refreshed_at: float = 0.0
+
+    def query(self) -> UnitsQuery:
+        return UnitsQuery(
+            era_id=self.era_id,
+            faction_ids=tuple(self.faction_ids),
+            sort_by=self.sort_by,
+            sort_order=self.sort_order,
+            filters=dict(self.filters)
+        )
+
+
+class SavedQueries(BaseModel):
+    queries: list[SavedQuery] = []
+
+
+def unit_digest(unit: Unit) -> str:
+    return hashlib.blake2b(unit.model_dump_json().encode(), digest_size=8).hexdigest()
+
+
+def page_digest(units: list[Unit]) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for unit in units:
+        digest.update(unit_digest(unit).encode())
+    return digest.hexdigest()
+
+
+def diff_units(previous: dict[int, tuple[str, str]], units: list[Unit]) -> tuple[QueryChanges, dict[int, tuple[str, str]]]:
+    current = {unit.unit_id: (unit.title, unit_digest(unit)) for unit in units}
+    changes = QueryChanges(
+        added=[title for unit_id, (title, _) in current.items() if unit_id not in previous],
+        removed=[title for unit_id, (title, _) in previous.items() if unit_id not in current],
+        changed=[
+            title for unit_id, (title, digest) in current.items()
+            if unit_id in previous and previous[unit_id][1] != digest
+        ]
+    )
+    return changes, current
+
+
+def _saved_queries_path() -> Path:
+    return Path(settings.saved_queries_file).expanduser()
+
+
+def load_saved_queries() -> dict[str, SavedQuery]:
+    try:
+        stored = SavedQueries.model_validate_json(_saved_queries_path().read_bytes())
+    except (OSError, ValidationError):
+        return {}
+    return {saved.name: saved for saved in stored.queries}
+
+
+def save_saved_queries(queries: dict[str, SavedQuery]) -> None:
+    path = _saved_queries_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix('.tmp')
+        temp_path.write_text(SavedQueries(queries=list(queries.values())).model_dump_json())
+        os.replace(temp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,45 @@
+import os
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from domains.settings import settings
+from domains.unit import Unit
+
+
+class Session(BaseModel):
+    era_id: int
+    faction_ids: list[int]
+    sort_by: str = 'title'
+    sort_order: str = 'asc'
+    filters: dict = {}
+    page: int = 1
+    pages: int = 0
+    page_size: int = 0
+    units: list[Unit] = []
+    saved_at: float = 0.0
+
+
+def _session_path() -> Path:
+    return Path(settings.session_file).expanduser()
+
+
+def load_session() -> Session | None:
+    path = _session_path()
+    try:
+        return Session.model_validate_json(path.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def save_session(session: Session) -> None:
+    path = _session_path()
+    session.saved_at = time.time()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix('.tmp')
+        temp_path.write_text(session.model_dump_json())
+        os.replace(temp_path, path)
+    except OSError:
+        pass
\ No newline at end of file
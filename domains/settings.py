@@ -2,6 +2,27 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     api_base_url: str = ''
+    api_transport: str = 'json'
+    prefetch_pages: int = 20
+    page_size_param: str = 'size'
+    max_page_size: int = 100
+    bulk_executor: str = 'process'
+    bulk_workers: int = 0
+    bulk_in_flight: int = 4
+    export_dir: str = '.'
+    cache_daemon_socket: str = '~/.maskirovka/cache.sock'
+    cache_daemon_memory_mb: int = 256
+    cache_daemon_ttl: float = 300.0
+    session_file: str = '~/.maskirovka/session.json'
+    saved_queries_file: str = '~/.maskirovka/saved_queries.json'
+    refresh_interval: float = 900.0
+    refresh_jitter: float = 0.2
+    refresh_concurrency: int = 2
+    frame_budget_ms: float = 16.0
+    lag_monitor: bool = True
+    diagnostics_log: str = '~/.maskirovka/diagnostics.log'
+    profile_dir: str = '~/.maskirovka/profiles'
+    profile_on_start: bool = False
     model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
\ No newline at end of file
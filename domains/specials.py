@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+
+from domains.unit import Unit
+
+_PARAMETERIZED = re.compile(r'^([A-Z][A-Z-]*?)-?(\d[\d/*-]*)$')
+_NESTED = re.compile(r'^([A-Z][A-Z0-9-]*)\((.*)\)$')
+
+
+def split_specials(specials: str) -> list[str]:
+    tokens: list[str] = []
+    depth = 0
+    current = ''
+
+    for char in specials:
+        if char == ',' and depth == 0:
+            tokens.append(current)
+            current = ''
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        current += char
+    tokens.append(current)
+
+    return [token.strip().upper() for token in tokens if token.strip()]
+
+
+@lru_cache(maxsize=4096)
+def special_terms(token: str) -> frozenset[str]:
+    token = token.strip().upper()
+    terms = {token}
+
+    nested = _NESTED.match(token)
+    if nested:
+        terms.add(nested.group(1))
+        for inner in split_specials(nested.group(2)):
+            terms |= special_terms(inner)
+        return frozenset(terms)
+
+    parameterized = _PARAMETERIZED.match(token)
+    if parameterized:
+        terms.add(parameterized.group(1))
+
+    return frozenset(terms)
+
+
+def tokenize_specials(specials: str) -> set[str]:
+    terms: set[str] = set()
+    for token in split_specials(specials):
+        terms |= special_terms(token)
+    return terms
+
+
+class SpecialsIndex:
+    def __init__(self):
+        self.vocabulary: dict[str, int] = {}
+        self.masks: dict[int, int] = {}
+        self.sources: dict[int, str] = {}
+        self._query_masks: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def _bit(self, term: str) -> int:
+        position = self.vocabulary.get(term)
+        if position is None:
+            position = len(self.vocabulary)
+            self.vocabulary[term] = position
+            self._query_masks.clear()
+        return 1 << position
+
+    def add(self, unit: Unit) -> int:
+        if self.sources.get(unit.unit_id) == unit.specials:
+            return self.masks[unit.unit_id]
+
+        mask = 0
+        for term in tokenize_specials(unit.specials):
+            mask |= self._bit(term)
+        self.masks[unit.unit_id] = mask
+        self.sources[unit.unit_id] = unit.specials
+        return mask
+
+    def remove(self, unit_id: int) -> None:
+        self.masks.pop(unit_id, None)
+        self.sources.pop(unit_id, None)
+
+    def update(self, units: list[Unit]) -> None:
+        sources = self.sources
+        for unit in units:
+            if sources.get(unit.unit_id) != unit.specials:
+                self.add(unit)
+
+    def query_mask(self, term: str) -> int:
+        term = term.strip().upper()
+        mask = self._query_masks.get(term)
+        if mask is None:
+            mask = 0
+            for known, position in self.vocabulary.items():
+                if term in known:
+                    mask |= 1 << position
+            self._query_masks[term] = mask
+        return mask
+
+    def matching(self, units: list[Unit], terms: list[str], mode: str = 'or') -> set[int]:
+        self.update(units)
+        query = [self.query_mask(term) for term in terms]
+        masks = self.masks
+        ids = [unit.unit_id for unit in units]
+
+        if mode == 'and':
+            if not query or not all(query):
+                return set()
+            for mask in query:
+                ids = [unit_id for unit_id in ids if masks[unit_id] & mask]
+            return set(ids)
+
+        combined = 0
+        for mask in query:
+            combined |= mask
+        return {unit_id for unit_id in ids if masks[unit_id] & combined}
+
+specials_index = SpecialsIndex()
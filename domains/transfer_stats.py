@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class TransferStats(BaseModel):
+    endpoint: str
+    content_type: str
+    content_encoding: str | None = None
+    wire_bytes: int
+    body_bytes: int
+    decode_ms: float
+    elapsed_ms: float = 0.0
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(self.body_bytes - self.wire_bytes, 0)
\ No newline at end of file
@@ -0,0 +1,74 @@
+import math
+from collections import Counter
+
+from domains.unit import Unit
+
+STAT_FIELDS = ['pv', 'armor', 'struc', 'short', 'medium', 'long']
+
+
+class RunningStat:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.minimum: int | None = None
+        self.maximum: int | None = None
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+
+class Histogram:
+    def __init__(self, bins: int = 16):
+        self.bins = bins
+        self.width = 1
+        self.counts = [0] * bins
+
+    def add(self, value: int) -> None:
+        value = max(value, 0)
+        while value >= self.width * self.bins:
+            self.counts = [
+                self.counts[i] + self.counts[i + 1]
+                for i in range(0, self.bins, 2)
+            ] + [0] * (self.bins // 2)
+            self.width *= 2
+        self.counts[value // self.width] += 1
+
+    @property
+    def upper(self) -> int:
+        used = max((i for i, count in enumerate(self.counts) if count), default=0)
+        return (used + 1) * self.width
+
+
+class QueryStats:
+    def __init__(self, bins: int = 16):
+        self.count = 0
+        self.fields = {field: RunningStat() for field in STAT_FIELDS}
+        self.histograms = {field: Histogram(bins) for field in STAT_FIELDS}
+        self.roles: Counter[str] = Counter()
+        self.unit_types: Counter[str] = Counter()
+
+    def add(self, units: list[Unit]) -> None:
+        for unit in units:
+            self.count += 1
+            for field in STAT_FIELDS:
+                value = getattr(unit, field)
+                self.fields[field].add(value)
+                self.histograms[field].add(value)
+            self.roles[unit.role] += 1
+            self.unit_types[unit.unit_type] += 1
+
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+
+def sparkline(histogram: Histogram) -> str:
+    used = math.ceil(histogram.upper / histogram.width)
+    counts = histogram.counts[:max(used, 1)]
+    peak = max(counts) or 1
+    return ''.join(
+        SPARK_CHARS[min(len(SPARK_CHARS) - 1, count * len(SPARK_CHARS) // (peak + 1))] if count else ' '
+        for count in counts
+    )
@@ -0,0 +1,165 @@
+import math
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from domains.local_query import apply_filters, narrows, sort_units
+from domains.unit import Unit
+from domains.unit_stats import QueryStats
+from domains.units_page import UnitsPage
+
+
+class UnitsQuery(BaseModel):
+    era_id: int
+    faction_ids: tuple[int, ...]
+    sort_by: str | None = None
+    sort_order: str | None = None
+    filters: dict = {}
+
+    def key(self) -> tuple:
+        filters = tuple(sorted((name, str(value)) for name, value in self.filters.items()))
+        return self.era_id, tuple(sorted(self.faction_ids)), self.sort_by, self.sort_order, filters
+
+    def base_key(self) -> tuple:
+        return self.era_id, tuple(sorted(self.faction_ids))
+
+    def sort_keys(self) -> list[tuple[str, str]]:
+        keys = [(self.sort_by or 'title', self.sort_order or 'asc')]
+        if keys[0][0] != 'title':
+            keys.append(('title', 'asc'))
+        return keys
+
+
+class CachedResult:
+    def __init__(self, query: UnitsQuery, total: int | None = None):
+        self.query = query
+        self.total = total
+        self.rows: list[Unit | None] = []
+        self.loaded = 0
+        self.stats = QueryStats()
+
+    def add_rows(self, offset: int, units: list[Unit]) -> None:
+        end = offset + len(units)
+        if len(self.rows) < end:
+            self.rows.extend([None] * (end - len(self.rows)))
+
+        fresh: list[Unit] = []
+        for index, unit in enumerate(units, offset):
+            if self.rows[index] is None:
+                fresh.append(unit)
+                self.loaded += 1
+            self.rows[index] = unit
+
+        self.stats.add(fresh)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.total is not None and self.loaded >= self.total
+
+    def get_range(self, offset: int, size: int) -> list[Unit] | None:
+        if self.total is None or (offset >= self.total and self.total > 0):
+            return None
+
+        end = min(offset + size, self.total)
+        rows = self.rows[offset:end]
+        if len(rows) < end - offset or any(unit is None for unit in rows):
+            return None
+        return rows
+
+    def units(self) -> list[Unit]:
+        return [unit for unit in self.rows if unit is not None]
+
+
+def total_pages(total: int, page_size: int) -> int:
+    return max(1, math.ceil(total / page_size))
+
+
+def paginate(units: list[Unit], page: int, page_size: int) -> tuple[list[Unit], int, int]:
+    pages = total_pages(len(units), page_size)
+    page = min(max(page, 1), pages)
+    start = (page - 1) * page_size
+    return units[start:start + page_size], page, pages
+
+
+class UnitsCache:
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CachedResult] = OrderedDict()
+
+    def get_entry(self, query: UnitsQuery) -> CachedResult | None:
+        return self._entries.get(query.key())
+
+    def get_page(self, query: UnitsQuery, page: int, page_size: int) -> tuple[list[Unit], int, int] | None:
+        entry = self._entries.get(query.key())
+        if entry is None:
+            return None
+
+        units = entry.get_range((page - 1) * page_size, page_size)
+        if units is None:
+            return None
+
+        self._touch(query.key())
+        return units, page, total_pages(entry.total, page_size)
+
+    def put_page(self, query: UnitsQuery, result: UnitsPage) -> None:
+        key = query.key()
+        entry = self._entries.get(key)
+        if entry is None or (
+            entry.total is not None and result.total is not None and entry.total != result.total
+        ):
+            entry = CachedResult(query, result.total)
+            self._entries[key] = entry
+        elif entry.total is None:
+            entry.total = result.total
+
+        entry.add_rows(result.offset, result.items)
+        self._touch(key)
+
+    def put_all(self, query: UnitsQuery, units: list[Unit]) -> None:
+        entry = CachedResult(query, len(units))
+        entry.add_rows(0, units)
+
+        key = query.key()
+        self._entries[key] = entry
+        self._touch(key)
+
+    def invalidate(self, query: UnitsQuery) -> None:
+        self._entries.pop(query.key(), None)
+
+    def _touch(self, key: tuple) -> None:
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def find_local(self, query: UnitsQuery, page: int, page_size: int) -> tuple[list[Unit], int, int] | None:
+        base_key = query.base_key()
+
+        best: CachedResult | None = None
+        for entry in self._entries.values():
+            if entry.query.base_key() != base_key or not entry.is_complete:
+                continue
+            if not narrows(entry.query.filters, query.filters):
+                continue
+            if best is None or entry.total < best.total:
+                best = entry
+
+        if best is None or best.query.key() == query.key():
+            return None
+
+        units = apply_filters(best.units(), best.query.filters, query.filters)
+        if (best.query.sort_by, best.query.sort_order) != (query.sort_by, query.sort_order):
+            units = sort_units(units, query.sort_keys())
+
+        self.put_all(query, units)
+        return paginate(units, page, page_size)
+
+    def all_units(self) -> list[Unit]:
+        units: dict[int, Unit] = {}
+        for entry in self._entries.values():
+            for unit in entry.units():
+                units[unit.unit_id] = unit
+        return list(units.values())
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from domains.unit import Unit
+
+
+class UnitsPage(BaseModel):
+    items: list[Unit]
+    page: int
+    pages: int
+    size: int
+    total: int | None = None
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.size
\ No newline at end of file
@@ -4,21 +4,40 @@ from textual import events, work
 from textual.app import App, ComposeResult
 from textual.containers import Vertical, Horizontal, Container
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widget import Widget
-from textual.widgets import Header, Footer, RadioSet, RadioButton, DataTable, Label, SelectionList, Static
+from textual.widgets import Header, Footer, RadioSet, RadioButton, DataTable, Label, SelectionList, Static, Input
 
 from domains.api_client import ApiClient, ApiError
 from domains.blocks import Blocks
+from domains.bulk_ingest import BulkIngest, collect_units, create_executor
+from domains.diagnostics import LoopLagMonitor, ProfileCapture, instrument, timed
 from domains.era import Era
+from domains.export import export_units_csv
 from domains.faction import Faction
+from domains.fuzzy_index import FuzzyIndex
+from domains.page_size import PageSizer
+from domains.refresh_scheduler import RefreshScheduler
+from domains.saved_queries import QueryChanges, SavedQuery, load_saved_queries, save_saved_queries
+from domains.session import Session, load_session, save_session
+from domains.settings import settings
+from domains.specials import specials_index
+from domains.transfer_stats import TransferStats
 from domains.unit import Unit
+from domains.units_cache import UnitsCache, UnitsQuery
+from domains.units_page import UnitsPage
 from screens.error_screen import ErrorScreen
 from screens.filter_screen import FilterScreen
+from screens.finder_screen import FinderScreen
+from screens.force_builder_screen import ForceBuilderScreen
+from screens.saved_queries_screen import SavedQueriesScreen
 from screens.sort_screen import SortScreen
 from screens.splash_screen import SplashScreen
+from screens.stats_panel import StatsPanel
 from screens.unit_details_screen import UnitDetailsScreen
 
 
+@instrument
 class Maskirovka(App):
     CSS_PATH = 'styles/styles_maskirovka.tcss'
 
@@ -27,10 +46,20 @@ class Maskirovka(App):
         ('ctrl+s', 'search', 'Поиск'),
         ('ctrl+o', 'sort', 'Сортировка'),
         ('ctrl+f', 'filter', 'Фильтр'),
+        ('ctrl+l', 'live_search', 'Быстрый поиск'),
+        ('ctrl+g', 'finder', 'Найти'),
+        ('ctrl+b', 'force_builder', 'Отряд'),
+        ('ctrl+t', 'toggle_stats', 'Статистика'),
+        ('ctrl+r', 'export', 'Экспорт'),
+        ('ctrl+y', 'saved_queries', 'Запросы'),
         ('ctrl+left', 'prev_page', 'Пред. страница'),
         ('ctrl+right', 'next_page', 'След. страница'),
+        ('f12', 'toggle_profile', 'Профиль'),
     ]
 
+    LIVE_SEARCH_DELAY = 0.3
+    RESIZE_DELAY = 0.2
+
     def __init__(self):
         super().__init__()
 
@@ -53,9 +82,29 @@ class Maskirovka(App):
         self.sort_order: str = 'asc'
         self.filters: dict = {}
         self.api_client = ApiClient()
+        self.units_cache = UnitsCache()
+        self.finder_index = FuzzyIndex()
+        self.last_transfer: TransferStats | None = None
+        self.current_query: UnitsQuery | None = None
+        self.session: Session | None = load_session()
+        self.stale = False
+        self._live_search_timer: Timer | None = None
+        self._page_size_timer: Timer | None = None
+        self.page_sizer = PageSizer(max_size=settings.max_page_size)
+        self.page_size = self.page_sizer.choose()
+        self.lag_monitor = LoopLagMonitor()
+        self.profile_capture = ProfileCapture()
+        self.saved_queries: dict[str, SavedQuery] = load_saved_queries()
+        self.refresh_scheduler = RefreshScheduler(self.api_client, self.units_cache)
 
     async def on_mount(self) -> None:
-        await self.push_screen(self.splash_screen)
+        if settings.lag_monitor:
+            self.lag_monitor.start()
+        if settings.profile_on_start:
+            self.profile_capture.start()
+
+        if self.session is None:
+            await self.push_screen(self.splash_screen)
 
         table = self.query_one(f"#{self.blocks[Blocks.MAIN_CONTENT]}", DataTable)
         table.add_columns(
@@ -70,7 +119,15 @@ class Maskirovka(App):
             'Структура',
         )
 
+        if self.session is not None:
+            self._show_session(self.session)
+
         self._load_initial_data()
+        self._refresh_saved_queries()
+
+    def on_unmount(self) -> None:
+        self.lag_monitor.stop()
+        self.profile_capture.stop()
 
     def on_key(self, event: events.Key) -> None:
         if isinstance(self.screen, ModalScreen):
@@ -91,6 +148,20 @@ class Maskirovka(App):
         if unit:
             self.push_screen(UnitDetailsScreen(unit=unit))
 
+    def on_resize(self, event: events.Resize) -> None:
+        if self._page_size_timer is not None:
+            self._page_size_timer.stop()
+        self._page_size_timer = self.set_timer(self.RESIZE_DELAY, self._apply_page_size)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != 'live-search':
+            return
+
+        self.workers.cancel_group(self, 'live-search')
+        if self._live_search_timer is not None:
+            self._live_search_timer.stop()
+        self._live_search_timer = self.set_timer(self.LIVE_SEARCH_DELAY, self._apply_live_search)
+
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         if isinstance(self.screen, ModalScreen):
             return
@@ -139,6 +210,10 @@ class Maskirovka(App):
                             id=self.blocks[Blocks.ERAS],
                             classes='border selected-border',
                         ),
+                        Input(
+                            placeholder='Быстрый поиск по названию...',
+                            id='live-search',
+                        ),
                         DataTable(
                             cursor_type='row',
                             id=self.blocks[Blocks.MAIN_CONTENT],
@@ -154,6 +229,11 @@ class Maskirovka(App):
                     ),
                     Static('Выберите фракцию', id='faction-hint', shrink=True),
                     id='right'
+                ),
+                StatsPanel(
+                    'Статистика появится после поиска',
+                    id='stats-panel',
+                    classes='border',
                 )
             ),
             id='main'
@@ -165,7 +245,10 @@ class Maskirovka(App):
         )
 
     async def action_search(self) -> None:
-        self._search(page=1)
+        self._search(page=1, use_cache=False, prefetch=True)
+
+    async def action_live_search(self) -> None:
+        self.query_one('#live-search', Input).focus()
 
     async def action_sort(self) -> None:
         async def handle_sort(result: dict | None) -> None:
@@ -186,6 +269,7 @@ class Maskirovka(App):
         async def handle_filter(result: dict | None) -> None:
             if result is not None:
                 self.filters = result
+                self.query_one('#live-search', Input).value = result.get('title', '')
                 self._search(page=1)
 
         await self.push_screen(
@@ -197,6 +281,81 @@ class Maskirovka(App):
             handle_filter
         )
 
+    async def action_finder(self) -> None:
+        async def handle_finder(result: str | None) -> None:
+            if result is None:
+                return
+
+            kind, _, value = result.partition(':')
+            if kind == 'faction':
+                selection_list = self.query_one(f"#{self.blocks[Blocks.FACTIONS]}", SelectionList)
+                selection_list.toggle(int(value))
+            elif kind == 'unit':
+                unit = self.finder_index.get(result)
+                if unit is not None:
+                    await self.push_screen(UnitDetailsScreen(unit=unit))
+
+        await self.push_screen(
+            FinderScreen(index=self.finder_index),
+            handle_finder
+        )
+
+    async def action_force_builder(self) -> None:
+        units = {unit.unit_id: unit for unit in self.units_cache.all_units()}
+        for unit in self.units or []:
+            units[unit.unit_id] = unit
+
+        await self.push_screen(
+            ForceBuilderScreen(
+                units=list(units.values()),
+                types=self.types,
+                roles=self.roles
+            )
+        )
+
+    async def action_toggle_stats(self) -> None:
+        panel = self.query_one('#stats-panel', StatsPanel)
+        panel.display = not panel.display
+        if panel.display and self.current_query is not None:
+            self._start_prefetch(self.current_query)
+
+    async def action_export(self) -> None:
+        if self.current_query is None:
+            await self.push_screen(
+                ErrorScreen(title='Следует вначале выполнить поиск')
+            )
+            return
+
+        self._export(self.current_query)
+
+    async def action_saved_queries(self) -> None:
+        async def handle_saved_queries(result: dict | None) -> None:
+            if result is None:
+                return
+
+            for name in result['removed']:
+                self.saved_queries.pop(name, None)
+                self.refresh_scheduler.forget(name)
+
+            if 'save' in result:
+                self._save_query(result['save'])
+            elif 'open' in result and result['open'] in self.saved_queries:
+                self._open_saved_query(self.saved_queries[result['open']])
+
+            save_saved_queries(self.saved_queries)
+
+        await self.push_screen(
+            SavedQueriesScreen(queries=self.saved_queries, can_save=self.current_query is not None),
+            handle_saved_queries
+        )
+
+    async def action_toggle_profile(self) -> None:
+        path = self.profile_capture.toggle()
+        if path is None:
+            self.notify('Профилирование запущено')
+        else:
+            self.notify(f'Профиль сохранён: {path}')
+
     async def action_prev_page(self) -> None:
         if self.page - 1 <= 0:
             return
@@ -219,7 +378,132 @@ class Maskirovka(App):
         except Exception as e:
             self.exception_on_splash = e
 
-        await self._hide_splash()
+        if self.session is None:
+            await self._hide_splash()
+            return
+
+        if self.exception_on_splash:
+            await self.push_screen(
+                ErrorScreen(title=f'{type(self.exception_on_splash).__name__}: {self.exception_on_splash}')
+            )
+            return
+
+        self._restore_selection(self.session.era_id, self.session.faction_ids)
+        self._revalidate_session(self.session)
+
+    def _show_session(self, session: Session) -> None:
+        self.sort_by = session.sort_by
+        self.sort_order = session.sort_order
+        self.filters = dict(session.filters)
+        self.units, self.page, self.pages = session.units, session.page, session.pages
+        self.page_size = session.page_size or self.page_size
+        self.query_one('#live-search', Input).value = self.filters.get('title', '')
+
+        self._set_stale(True)
+        self._render_units(focus=False)
+
+    def _restore_selection(self, era_id: int, faction_ids: list[int]) -> None:
+        radio_set = self.query_one(f"#{self.blocks[Blocks.ERAS]}", RadioSet)
+        buttons = list(radio_set.query(RadioButton))
+        for index, era in enumerate(self.eras or []):
+            if era.era_id == era_id and index < len(buttons):
+                buttons[index].value = True
+
+        selection_list = self.query_one(f"#{self.blocks[Blocks.FACTIONS]}", SelectionList)
+        selection_list.deselect_all()
+        known = {faction.faction_id for faction in self.factions or []}
+        for faction_id in faction_ids:
+            if faction_id in known:
+                selection_list.select(faction_id)
+
+    @work(exclusive=False)
+    async def _revalidate_session(self, session: Session) -> None:
+        try:
+            query = UnitsQuery(
+                era_id=session.era_id,
+                faction_ids=tuple(session.faction_ids),
+                sort_by=self.sort_by,
+                sort_order=self.sort_order,
+                filters=dict(self.filters)
+            )
+
+            units, page, pages = await self._fetch_units(query, session.page, use_cache=False)
+            self.current_query = query
+
+            self._set_stale(False)
+            if (units, page, pages) != (self.units, self.page, self.pages):
+                self.units, self.page, self.pages = units, page, pages
+                self._render_units(focus=False)
+
+            self._save_session(query)
+            self._update_stats()
+            self._start_prefetch(query)
+
+        except ApiError as e:
+            await self.push_screen(
+                ErrorScreen(title=f'Ошибка API: {e}')
+            )
+        except Exception as e:
+            await self.push_screen(
+                ErrorScreen(title=f'{type(e).__name__}: {e}')
+            )
+
+    def _set_stale(self, stale: bool) -> None:
+        self.stale = stale
+
+        table = self.query_one(f"#{self.blocks[Blocks.MAIN_CONTENT]}", DataTable)
+        table.set_class(stale, 'stale')
+        self._update_pagination_label()
+
+    def _save_session(self, query: UnitsQuery) -> None:
+        save_session(Session(
+            era_id=query.era_id,
+            faction_ids=list(query.faction_ids),
+            sort_by=self.sort_by,
+            sort_order=self.sort_order,
+            filters=self.filters,
+            page=self.page,
+            pages=self.pages,
+            page_size=self.page_size,
+            units=self.units or []
+        ))
+
+    def _save_query(self, name: str) -> None:
+        query = self.current_query
+        self.saved_queries[name] = SavedQuery(
+            name=name,
+            era_id=query.era_id,
+            faction_ids=list(query.faction_ids),
+            sort_by=query.sort_by,
+            sort_order=query.sort_order,
+            filters=dict(query.filters),
+            page_size=self.page_size
+        )
+        self.refresh_scheduler.forget(name)
+        self.notify(f'Запрос «{name}» сохранён')
+
+    def _open_saved_query(self, saved: SavedQuery) -> None:
+        self.sort_by = saved.sort_by
+        self.sort_order = saved.sort_order
+        self.filters = dict(saved.filters)
+        self.query_one('#live-search', Input).value = self.filters.get('title', '')
+        self._restore_selection(saved.era_id, saved.faction_ids)
+        self._search(page=1, query=saved.query())
+
+    def _on_saved_query_refreshed(self, saved: SavedQuery, changes: QueryChanges | None) -> None:
+        if saved.name in self.saved_queries:
+            save_saved_queries(self.saved_queries)
+
+        if changes is None or changes.empty:
+            return
+
+        lines = []
+        for sign, titles in (('+', changes.added), ('−', changes.removed), ('~', changes.changed)):
+            if titles:
+                more = f' и ещё {len(titles) - 5}' if len(titles) > 5 else ''
+                lines.append(f'{sign} {", ".join(titles[:5])}{more}')
+
+        self.notify('\n'.join(lines), title=f'Запрос «{saved.name}» изменился', timeout=15)
 
     def _set_selected_block(self, block: Blocks) -> None:
         if self.current_block == block:
@@ -284,6 +568,7 @@ class Maskirovka(App):
                 ErrorScreen(title=f'{type(self.exception_on_splash).__name__}: {self.exception_on_splash}')
             )
 
+    @timed
     async def _load_eras(self) -> None:
         self.eras = await self.api_client.get_eras()
 
@@ -291,6 +576,7 @@ class Maskirovka(App):
         for item in self.eras:
             await radio_set.mount(RadioButton(item.title))
 
+    @timed
     async def _load_factions(self) -> None:
         self.factions = await self.api_client.get_factions()
 
@@ -298,6 +584,9 @@ class Maskirovka(App):
         options = [(item.title, item.faction_id) for item in self.factions]
         selection_list.add_options(options)
 
+        for item in self.factions:
+            self.finder_index.add(f'faction:{item.faction_id}', item.title, item)
+
     async def _load_types(self) -> None:
         self.types = await self.api_client.get_types()
 
@@ -308,76 +597,273 @@ class Maskirovka(App):
         selection_list = self.query_one(f"#{self.blocks[Blocks.FACTIONS]}", SelectionList)
         return list(selection_list.selected)
 
-    @work(exclusive=False)
-    async def _search(self, page: int) -> None:
-        try:
-            if not self.eras or not self.factions:
-                await self.push_screen(
-                    ErrorScreen(title='Данные не загружены. Подождите завершения загрузки.')
-                )
-                return
+    def _measure_visible_rows(self) -> None:
+        table = self.query_one(f"#{self.blocks[Blocks.MAIN_CONTENT]}", DataTable)
+        rows = table.size.height - table.header_height
+        if rows > 0:
+            self.page_sizer.visible_rows = rows
+
+    def _apply_page_size(self) -> None:
+        self._page_size_timer = None
+        self._measure_visible_rows()
+
+        page_size = self.page_sizer.choose()
+        if page_size == self.page_size:
+            return
+
+        if self.current_query is None or not self.units:
+            self.page_size = page_size
+            return
+
+        offset = (self.page - 1) * self.page_size
+        self.page_size = page_size
+        self._search(page=offset // page_size + 1)
+
+    def _apply_live_search(self) -> None:
+        self._live_search_timer = None
 
+        title = self.query_one('#live-search', Input).value.strip()
+        if title == self.filters.get('title', ''):
+            return
+
+        filters = {key: value for key, value in self.filters.items() if key != 'title'}
+        if title:
+            filters['title'] = title
+        self.filters = filters
+
+        self._live_search(page=1)
+
+    async def _build_query(self, show_errors: bool = True) -> UnitsQuery | None:
+        error: str | None = None
+        era_index: int | None = None
+        faction_ids: list[int] = []
+
+        if not self.eras or not self.factions:
+            error = 'Данные не загружены. Подождите завершения загрузки.'
+        else:
             faction_ids = self._get_selected_faction_ids()
 
             radio_set_eras = self.query_one(f"#{self.blocks[Blocks.ERAS]}", RadioSet)
             era_index = radio_set_eras.pressed_index
 
             if not faction_ids or era_index is None or era_index < 0:
-                await self.push_screen(
-                    ErrorScreen(title='Следует вначале выбрать эру и фракцию')
-                )
-                return
+                error = 'Следует вначале выбрать эру и фракцию'
+            elif era_index >= len(self.eras):
+                error = 'Некорректный выбор эры или фракции'
+
+        if error is not None:
+            if show_errors:
+                await self.push_screen(ErrorScreen(title=error))
+            return None
+
+        return UnitsQuery(
+            era_id=self.eras[era_index].era_id,
+            faction_ids=tuple(faction_ids),
+            sort_by=self.sort_by,
+            sort_order=self.sort_order,
+            filters=dict(self.filters)
+        )
 
-            if era_index >= len(self.eras):
-                await self.push_screen(
-                    ErrorScreen(title='Некорректный выбор эры или фракции')
-                )
-                return
+    async def _fetch_units(self, query: UnitsQuery, page: int, use_cache: bool) -> tuple[list[Unit], int, int]:
+        self.last_transfer = None
+
+        if not use_cache:
+            self.units_cache.invalidate(query)
+        else:
+            cached = self.units_cache.get_page(query, page, self.page_size)
+            if cached is None:
+                cached = self.units_cache.find_local(query, page, self.page_size)
+            if cached is not None:
+                return cached
+
+        result = await self._download_page(query, page)
+        self.last_transfer = self.api_client.last_transfer
+
+        return result.items, result.page, result.pages
+
+    async def _download_page(self, query: UnitsQuery, page: int) -> UnitsPage:
+        result = await self.api_client.get_units_page(
+            era_id=query.era_id,
+            faction_ids=list(query.faction_ids),
+            page=page,
+            sort_by=query.sort_by,
+            sort_order=query.sort_order,
+            filters=query.filters if query.filters else None,
+            page_size=self.page_size
+        )
+        self._ingest_page(query, result)
 
-            era_id = self.eras[era_index].era_id
+        if self.api_client.last_transfer is not None:
+            self.page_sizer.observe(self.api_client.last_transfer, len(result.items))
+        self.page_size = result.size
 
-            self.units, self.page, self.pages = await self.api_client.get_units(
-                era_id=era_id,
-                faction_ids=faction_ids,
-                page=page,
-                sort_by=self.sort_by,
-                sort_order=self.sort_order,
-                filters=self.filters if self.filters else None
+        return result
+
+    @timed
+    def _ingest_page(self, query: UnitsQuery, result: UnitsPage) -> None:
+        self.units_cache.put_page(query, result)
+
+        for unit in result.items:
+            self.finder_index.add(f'unit:{unit.unit_id}', unit.title, unit)
+            specials_index.add(unit)
+
+    @timed
+    def _render_units(self, focus: bool = True) -> None:
+        table = self.query_one(f"#{self.blocks[Blocks.MAIN_CONTENT]}", DataTable)
+        table.clear()
+
+        if not self.units:
+            table.add_row('—', '-', '—', '—', '—', '—', '—', '—', '—')
+            self._update_pagination_label()
+            self.refresh_bindings()
+            return
+
+        for item in self.units:
+            table.add_row(
+                item.title,
+                item.role,
+                str(item.pv),
+                item.mv,
+                str(item.short),
+                str(item.medium),
+                str(item.long),
+                str(item.armor),
+                str(item.struc),
+                key=str(item.unit_id)
             )
 
-            table = self.query_one(f"#{self.blocks[Blocks.MAIN_CONTENT]}", DataTable)
-            table.loading = True
-            table.clear()
+        if focus:
+            table.focus()
+
+        self._update_pagination_label()
+
+        self.refresh_bindings()
+
+    def _update_pagination_label(self) -> None:
+        pagination_label = self.query_one("#pagination-info", Label)
+
+        if not self.units:
+            text = 'Страница: 0 из 0 (нет результатов)'
+        else:
+            text = f'Страница: {self.page} из {self.pages}{self._format_transfer()}'
+
+        if self.stale:
+            text += ' · сохранённые данные, обновление...'
 
-            if not self.units:
-                table.add_row('—', '-', '—', '—', '—', '—', '—', '—', '—')
-                table.loading = False
-                pagination_label = self.query_one("#pagination-info", Label)
-                pagination_label.update(f'Страница: 0 из 0 (нет результатов)')
-                self.refresh_bindings()
+        pagination_label.update(text)
+
+    def _format_transfer(self) -> str:
+        if self.last_transfer is None:
+            return ''
+
+        transfer = self.last_transfer
+        text = f' · {transfer.wire_bytes / 1024:.1f} КБ'
+        if transfer.saved_bytes:
+            text += f' (без сжатия {transfer.body_bytes / 1024:.1f} КБ)'
+        return f'{text}, разбор {transfer.decode_ms:.1f} мс'
+
+    async def _run_search(
+        self,
+        page: int,
+        use_cache: bool = True,
+        interactive: bool = True,
+        query: UnitsQuery | None = None,
+        prefetch: bool = False
+    ) -> None:
+        try:
+            query = query or await self._build_query(show_errors=interactive)
+            if query is None:
                 return
 
-            for item in self.units:
-                table.add_row(
-                    item.title,
-                    item.role,
-                    str(item.pv),
-                    item.mv,
-                    str(item.short),
-                    str(item.medium),
-                    str(item.long),
-                    str(item.armor),
-                    str(item.struc),
-                    key=str(item.unit_id)
-                )
+            if page == 1:
+                self._measure_visible_rows()
+                self.page_size = self.page_sizer.choose()
 
-            table.loading = False
-            table.focus()
+            self.units, self.page, self.pages = await self._fetch_units(query, page, use_cache)
+            self.current_query = query
 
-            pagination_label = self.query_one("#pagination-info", Label)
-            pagination_label.update(f'Страница: {self.page} из {self.pages}')
+            self._set_stale(False)
+            self._render_units(focus=interactive)
+            self._save_session(query)
+            self._update_stats()
+            if interactive:
+                self._start_prefetch(query, requested=prefetch)
 
-            self.refresh_bindings()
+        except ApiError as e:
+            await self.push_screen(
+                ErrorScreen(title=f'Ошибка API: {e}')
+            )
+        except Exception as e:
+            await self.push_screen(
+                ErrorScreen(title=f'{type(e).__name__}: {e}')
+            )
+
+    @timed
+    def _update_stats(self) -> None:
+        entry = self.units_cache.get_entry(self.current_query) if self.current_query else None
+        self.query_one('#stats-panel', StatsPanel).show(entry)
+
+    def _start_prefetch(self, query: UnitsQuery, requested: bool = False) -> None:
+        if not requested and not self.query_one('#stats-panel', StatsPanel).display:
+            return
+        if self.pages > settings.prefetch_pages:
+            return
+        self._prefetch_pages(query)
+
+    @work(exclusive=True, group='prefetch')
+    async def _prefetch_pages(self, query: UnitsQuery) -> None:
+        page_size = self.page_size
+        for page in range(1, self.pages + 1):
+            if page_size != self.page_size or query != self.current_query:
+                return
+            if self.units_cache.get_page(query, page, page_size) is not None:
+                continue
+            try:
+                await self._download_page(query, page)
+            except ApiError:
+                return
+            if query == self.current_query:
+                self._update_stats()
+
+    @work(exclusive=True, group='export')
+    async def _export(self, query: UnitsQuery) -> None:
+        try:
+            entry = self.units_cache.get_entry(query)
+            if entry is not None and entry.is_complete:
+                units = entry.units()
+            else:
+                self.notify('Загрузка всех страниц для экспорта...')
+
+                def on_page(result: UnitsPage) -> None:
+                    self._ingest_page(query, result)
+                    if query == self.current_query:
+                        self._update_stats()
+
+                def cached_page(page: int, page_size: int) -> UnitsPage | None:
+                    cached = self.units_cache.get_page(query, page, page_size)
+                    if cached is None:
+                        return None
+                    units, page, pages = cached
+                    total = self.units_cache.get_entry(query).total
+                    return UnitsPage(items=units, page=page, pages=pages, size=page_size, total=total)
+
+                executor = create_executor()
+                try:
+                    pages = await BulkIngest(self.api_client, executor).run(
+                        query, self.page_size, on_page, cached=cached_page
+                    )
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+                units = collect_units(pages)
+                if units is None:
+                    await self.push_screen(
+                        ErrorScreen(title='Результат запроса изменился во время загрузки, повторите экспорт')
+                    )
+                    return
+
+            path = export_units_csv(units)
+            self.notify(f'Экспортировано юнитов: {len(units)} ({path})')
 
         except ApiError as e:
             await self.push_screen(
@@ -388,6 +874,27 @@ class Maskirovka(App):
                 ErrorScreen(title=f'{type(e).__name__}: {e}')
             )
 
+    @work(exclusive=True, group='saved-queries')
+    async def _refresh_saved_queries(self) -> None:
+        await self.refresh_scheduler.run(
+            queries=lambda: list(self.saved_queries.values()),
+            on_refreshed=self._on_saved_query_refreshed,
+            on_page=self._ingest_page
+        )
+
+    @work(exclusive=False)
+    async def _search(
+        self,
+        page: int,
+        use_cache: bool = True,
+        query: UnitsQuery | None = None,
+        prefetch: bool = False
+    ) -> None:
+        await self._run_search(page, use_cache=use_cache, query=query, prefetch=prefetch)
+
+    @work(exclusive=True, group='live-search')
+    async def _live_search(self, page: int) -> None:
+        await self._run_search(page, interactive=False)
 
 if __name__ == '__main__':
     app = Maskirovka()
@@ -4,7 +4,10 @@ from textual.containers import Grid
 from textual.screen import Screen
 from textual.widgets import Button, Label
 
+from domains.diagnostics import instrument
 
+
+@instrument
 class ErrorScreen(Screen):
     BINDINGS = [Binding('escape', 'close', 'Закрыть')]
     CSS_PATH = '../styles/styles_error.tcss'
@@ -4,7 +4,10 @@ from textual.containers import Vertical, Horizontal, Grid, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Label, Button, Input, Select
 
+from domains.diagnostics import instrument
 
+
+@instrument
 class FilterScreen(ModalScreen):
     BINDINGS = [Binding('escape', 'cancel', 'Отмена')]
     CSS_PATH = '../styles/styles_filter.tcss'
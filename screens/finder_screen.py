@@ -0,0 +1,64 @@
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Label, Input, OptionList
+from textual.widgets.option_list import Option
+
+from domains.diagnostics import instrument
+from domains.fuzzy_index import FuzzyIndex
+
+
+@instrument
+class FinderScreen(ModalScreen):
+    BINDINGS = [
+        Binding('escape', 'cancel', 'Отмена'),
+        Binding('down', 'cursor_down', show=False),
+        Binding('up', 'cursor_up', show=False),
+    ]
+    CSS_PATH = '../styles/styles_finder.tcss'
+
+    KIND_LABELS = {
+        'faction': 'Фракция',
+        'unit': 'Юнит',
+    }
+
+    def __init__(self, index: FuzzyIndex, limit: int = 30, **kwargs):
+        super().__init__(**kwargs)
+        self.index = index
+        self.limit = limit
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='finder-container'):
+            yield Label('Поиск фракций и юнитов', id='finder-title')
+            yield Input(placeholder='Начните вводить название...', id='finder-input')
+            yield OptionList(id='finder-results')
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        results = self.query_one('#finder-results', OptionList)
+        results.clear_options()
+
+        for key, title, _ in self.index.search(event.value, limit=self.limit):
+            kind = key.split(':', 1)[0]
+            results.add_option(Option(f'{self.KIND_LABELS.get(kind, kind)}: {title}', id=key))
+
+        if results.option_count:
+            results.highlighted = 0
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        results = self.query_one('#finder-results', OptionList)
+        if results.highlighted is None:
+            return
+        self.dismiss(results.get_option_at_index(results.highlighted).id)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(event.option.id)
+
+    def action_cursor_down(self) -> None:
+        self.query_one('#finder-results', OptionList).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        self.query_one('#finder-results', OptionList).action_cursor_up()
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
@@ -0,0 +1,135 @@
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical, Horizontal, Grid
+from textual.screen import ModalScreen
+from textual.widgets import Label, Button, Input, Select, DataTable
+from textual.worker import get_current_worker
+
+from domains.diagnostics import instrument
+from domains.force_builder import ForceBuilder, ForceList, SCORES
+from domains.unit import Unit
+
+
+@instrument
+class ForceBuilderScreen(ModalScreen):
+    BINDINGS = [Binding('escape', 'close', 'Закрыть')]
+    CSS_PATH = '../styles/styles_force_builder.tcss'
+
+    ALL_VALUE = 'ALL'
+
+    def __init__(
+        self,
+        units: list[Unit],
+        types: list[str] | None = None,
+        roles: list[str] | None = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.units = units
+        self.types = [('Все', self.ALL_VALUE)] + [(t, t) for t in (types or [])]
+        self.roles = [('Все', self.ALL_VALUE)] + [(t, t) for t in (roles or [])]
+        self.results: list[ForceList] = []
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='force-container'):
+            yield Label(f'Сборка отряда (доступно юнитов: {len(self.units)})', id='force-title')
+
+            with Grid(id='force-grid'):
+                yield Label('Бюджет PV:')
+                yield Input(value='300', placeholder='PV', id='force-budget', type='integer')
+
+                yield Label('Юнитов от/до:')
+                with Horizontal(classes='force-count-row'):
+                    yield Input(value='4', id='force-min-count', type='integer')
+                    yield Input(value='4', id='force-max-count', type='integer')
+
+                yield Label('Оценка:')
+                yield Select(
+                    [(label, key) for key, (label, _) in SCORES.items()],
+                    value='damage',
+                    id='force-score'
+                )
+
+                yield Label('Роль:')
+                yield Select(self.roles, value=self.ALL_VALUE, id='force-role')
+
+                yield Label('Тип:')
+                yield Select(self.types, value=self.ALL_VALUE, id='force-unit-type')
+
+            yield DataTable(cursor_type='row', id='force-results')
+            yield Label('', id='force-status')
+
+            with Horizontal(id='button-container'):
+                yield Button('Собрать', variant='primary', id='build')
+                yield Button('Закрыть', id='close')
+
+    def on_mount(self) -> None:
+        table = self.query_one('#force-results', DataTable)
+        table.add_columns('Оценка', 'PV', 'Состав')
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == 'build':
+            self._build(ForceBuilder(
+                units=self.units,
+                budget=self._get_int('force-budget', 300),
+                min_count=self._get_int('force-min-count', 1),
+                max_count=self._get_int('force-max-count', 4),
+                score=self.query_one('#force-score', Select).value or 'damage',
+                roles=self._get_constraint('force-role'),
+                unit_types=self._get_constraint('force-unit-type')
+            ))
+        elif event.button.id == 'close':
+            self.dismiss(None)
+
+    def action_close(self) -> None:
+        self.dismiss(None)
+
+    def _get_int(self, input_id: str, default: int) -> int:
+        try:
+            return int(self.query_one(f'#{input_id}', Input).value)
+        except ValueError:
+            return default
+
+    def _get_constraint(self, select_id: str) -> set[str] | None:
+        value = self.query_one(f'#{select_id}', Select).value
+        if value == Select.BLANK or value == self.ALL_VALUE:
+            return None
+        return {value}
+
+    @work(exclusive=True, thread=True)
+    def _build(self, builder: ForceBuilder) -> None:
+        worker = get_current_worker()
+
+        self.app.call_from_thread(self._show_status, f'Поиск среди {len(builder.candidates)} кандидатов...')
+
+        found = False
+        for results in builder.search(should_stop=lambda: worker.is_cancelled):
+            found = True
+            self.app.call_from_thread(self._show_results, results)
+
+        if worker.is_cancelled:
+            return
+
+        if builder.finished:
+            status = 'Готово' if found else 'Подходящих отрядов не найдено'
+        elif found:
+            status = f'Лучшее найденное за {builder.elapsed:.1f} с'
+        else:
+            status = f'За {builder.elapsed:.1f} с подходящих отрядов не найдено'
+        self.app.call_from_thread(self._show_status, status)
+
+    def _show_status(self, text: str) -> None:
+        self.query_one('#force-status', Label).update(text)
+
+    def _show_results(self, results: list[ForceList]) -> None:
+        self.results = results
+
+        table = self.query_one('#force-results', DataTable)
+        table.clear()
+        for force in results:
+            table.add_row(
+                str(force.score),
+                str(force.pv),
+                ', '.join(unit.title for unit in force.units)
+            )
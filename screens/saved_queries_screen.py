@@ -0,0 +1,66 @@
+import time
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Label, Input, OptionList
+from textual.widgets.option_list import Option
+
+from domains.diagnostics import instrument
+from domains.saved_queries import SavedQuery
+
+
+@instrument
+class SavedQueriesScreen(ModalScreen):
+    BINDINGS = [
+        Binding('escape', 'cancel', 'Отмена'),
+        Binding('delete', 'delete', 'Удалить'),
+    ]
+    CSS_PATH = '../styles/styles_saved_queries.tcss'
+
+    def __init__(self, queries: dict[str, SavedQuery], can_save: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.queries = queries
+        self.can_save = can_save
+        self.removed: list[str] = []
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='saved-container'):
+            yield Label('Сохранённые запросы', id='saved-title')
+            yield Input(
+                placeholder='Название для текущего запроса' if self.can_save else 'Вначале выполните поиск',
+                disabled=not self.can_save,
+                id='saved-name'
+            )
+            yield OptionList(
+                *[Option(self._describe(saved), id=saved.name) for saved in self.queries.values()],
+                id='saved-list'
+            )
+            yield Label('Enter — сохранить/открыть, Del — удалить', id='saved-hint')
+
+    def _describe(self, saved: SavedQuery) -> str:
+        if not saved.refreshed_at:
+            return f'{saved.name} — ещё не обновлялся'
+        refreshed = time.strftime('%d.%m %H:%M', time.localtime(saved.refreshed_at))
+        return f'{saved.name} — юнитов: {len(saved.units)}, обновлён {refreshed}'
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        name = event.value.strip()
+        if name:
+            self.dismiss({'save': name, 'removed': self.removed})
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss({'open': event.option.id, 'removed': self.removed})
+
+    def action_delete(self) -> None:
+        options = self.query_one('#saved-list', OptionList)
+        if not options.has_focus or options.highlighted is None:
+            return
+
+        option = options.get_option_at_index(options.highlighted)
+        self.removed.append(option.id)
+        options.remove_option(option.id)
+
+    def action_cancel(self) -> None:
+        self.dismiss({'removed': self.removed} if self.removed else None)
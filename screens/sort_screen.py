@@ -4,7 +4,10 @@ from textual.containers import Vertical, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Label, Button, RadioSet, RadioButton
 
+from domains.diagnostics import instrument
 
+
+@instrument
 class SortScreen(ModalScreen):
     BINDINGS = [Binding('escape', 'cancel', 'Отмена')]
     CSS_PATH = '../styles/styles_sort.tcss'
@@ -4,7 +4,10 @@ from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static
 
+from domains.diagnostics import instrument, timed
 
+
+@instrument
 class MatrixRain(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -14,6 +17,7 @@ class MatrixRain(Static):
     def on_mount(self) -> None:
         self.set_interval(0.05, self.update_matrix)
 
+    @timed
     def update_matrix(self) -> None:
         width = self.size.width
         height = self.size.height
@@ -0,0 +1,42 @@
+from textual.widgets import Static
+
+from domains.unit_stats import STAT_FIELDS, sparkline
+from domains.units_cache import CachedResult
+
+
+class StatsPanel(Static):
+    FIELD_LABELS = {
+        'pv': 'Стоимость',
+        'armor': 'Броня',
+        'struc': 'Структура',
+        'short': 'Ближняя',
+        'medium': 'Средняя',
+        'long': 'Дальняя',
+    }
+
+    def show(self, entry: CachedResult | None) -> None:
+        if entry is None or not entry.stats.count:
+            self.update('Статистика появится после поиска')
+            return
+
+        stats = entry.stats
+        lines = [
+            f'[b]Юнитов:[/b] {stats.count}',
+            f'Загружено: {entry.loaded} из {entry.total if entry.total is not None else "?"}',
+            '',
+        ]
+
+        for field in STAT_FIELDS:
+            value = stats.fields[field]
+            histogram = stats.histograms[field]
+            lines.append(f'[b]{self.FIELD_LABELS[field]}[/b]')
+            lines.append(f' {value.minimum} / {value.mean:.1f} / {value.maximum}')
+            lines.append(f' {sparkline(histogram)} 0–{histogram.upper}')
+
+        lines.append('')
+        lines.append('[b]Роли[/b]')
+        lines += [f' {role}: {count}' for role, count in stats.roles.most_common()]
+        lines.append('[b]Типы[/b]')
+        lines += [f' {unit_type}: {count}' for unit_type, count in stats.unit_types.most_common()]
+
+        self.update('\n'.join(lines))
\ No newline at end of file
@@ -4,9 +4,11 @@ from textual.containers import Vertical, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Label, Button, Link
 
+from domains.diagnostics import instrument
 from domains.unit import Unit
 
 
+@instrument
 class UnitDetailsScreen(ModalScreen):
     BINDINGS = [Binding('escape', 'close', 'Закрыть')]
     CSS_PATH = '../styles/styles_unit_details.tcss'
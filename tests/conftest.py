@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domains.unit import Unit
+
+
+@pytest.fixture
+def make_unit():
+    def make(unit_id: int, **fields) -> Unit:
+        values = dict(
+            unit_id=unit_id,
+            unit_type='BM',
+            title=f'Unit {unit_id}',
+            pv=20,
+            role='Brawler',
+            sz=2,
+            mv='8"',
+            short=2,
+            medium=2,
+            long=1,
+            extreme=0,
+            ov=0,
+            armor=4,
+            struc=3,
+            threshold=0,
+            specials=''
+        )
+        values.update(fields)
+        return Unit(**values)
+
+    return make
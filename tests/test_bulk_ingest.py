@@ -0,0 +1,26 @@
+from domains.bulk_ingest import collect_units
+from domains.units_page import UnitsPage
+
+
+def _pages(units, size, total):
+    return [
+        UnitsPage(items=units[start:start + size], page=page, pages=-(-len(units) // size), size=size, total=total)
+        for page, start in enumerate(range(0, len(units), size), 1)
+    ]
+
+
+def test_collects_pages_in_order(make_unit):
+    units = [make_unit(i) for i in range(7)]
+
+    assert collect_units(_pages(units, 3, 7)) == units
+    assert collect_units(_pages(units, 3, None)) == units
+
+
+def test_rejects_changed_result(make_unit):
+    units = [make_unit(i) for i in range(7)]
+
+    pages = _pages(units, 3, 7)
+    pages[2] = pages[2].model_copy(update={'total': 8})
+    assert collect_units(pages) is None
+
+    assert collect_units(_pages(units[:6], 3, 7)) is None
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+from domains.cache_daemon import CachedResponse, CacheDaemon
+
+
+def _daemon(upstream='http://api.example:8000') -> CacheDaemon:
+    return CacheDaemon(socket_path='/tmp/unused.sock', upstream=upstream, memory_budget=1024, ttl=60.0)
+
+
+def test_foreign_host_is_misdirected():
+    daemon = _daemon()
+    response = asyncio.run(daemon._respond('GET', '/eras', {'host': 'other.example:8000'}))
+
+    assert response.status == 421
+    assert daemon.stats.misdirected == 1
+    assert daemon.stats.upstream == 0
+
+
+def test_cache_key_includes_upstream_origin():
+    cached = CachedResponse(status=200, body=b'[]', fetched_at=time.monotonic())
+    daemon, other = _daemon(), _daemon('https://api.example:8000')
+    for instance in (daemon, other):
+        instance._entries[('http://api.example:8000', '/eras', ())] = cached
+
+    assert asyncio.run(daemon._respond('GET', '/eras', {'host': 'API.example:8000'})) is cached
+    assert daemon.stats.hits == 1
+
+    other._fetch = lambda *args: asyncio.sleep(0, CachedResponse(status=502))
+    assert asyncio.run(other._respond('GET', '/eras', {'host': 'api.example:8000'})).status == 502
+    assert other.stats.hits == 0
+
+
+def test_default_port_is_normalized():
+    daemon = _daemon('http://api.example:80/v1')
+
+    assert daemon._serves('api.example')
+    assert daemon._serves('API.example:80')
+    assert not daemon._serves('api.example:8080')
+    assert not daemon._serves('')
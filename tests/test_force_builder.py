@@ -0,0 +1,62 @@
+import itertools
+import random
+
+import pytest
+
+from domains import force_builder
+from domains.force_builder import SCORES, ForceBuilder
+
+
+def _brute_force(units, budget, min_count, max_count, score, top=5):
+    value = SCORES[score][1]
+    scores = [
+        sum(value(unit) for unit in combo)
+        for size in range(min_count, max_count + 1)
+        for combo in itertools.combinations(units, size)
+        if sum(unit.pv for unit in combo) <= budget
+    ]
+    return sorted(scores, reverse=True)[:top]
+
+
+@pytest.mark.parametrize('cells', [force_builder.MAX_BOUND_CELLS, 50])
+@pytest.mark.parametrize('seed', range(12))
+def test_matches_brute_force(make_unit, monkeypatch, seed, cells):
+    monkeypatch.setattr(force_builder, 'MAX_BOUND_CELLS', cells)
+    rng = random.Random(seed)
+    units = [
+        make_unit(
+            unit_id,
+            pv=rng.randint(5, 40),
+            short=rng.randint(0, 5),
+            medium=rng.randint(0, 5),
+            long=rng.randint(0, 4),
+            armor=rng.randint(1, 10),
+            struc=rng.randint(1, 6)
+        )
+        for unit_id in range(rng.randint(6, 14))
+    ]
+    budget = rng.randint(30, 120)
+    min_count = rng.randint(1, 3)
+    max_count = rng.randint(min_count, 5)
+    score = rng.choice(list(SCORES))
+
+    builder = ForceBuilder(units, budget, min_count, max_count, score)
+    results = list(builder.search(time_limit=10))
+
+    assert builder.finished
+    found = results[-1] if results else []
+    assert [force.score for force in found] == _brute_force(units, budget, min_count, max_count, score)
+    for force in found:
+        assert force.pv <= budget
+        assert min_count <= len(force.units) <= max_count
+        assert len({unit.unit_id for unit in force.units}) == len(force.units)
+
+
+def test_reports_cut_off_search(make_unit):
+    units = [make_unit(unit_id, pv=10 + unit_id % 7) for unit_id in range(40)]
+    builder = ForceBuilder(units, 100, 2, 6)
+
+    results = list(builder.search(time_limit=0))
+
+    assert not builder.finished
+    assert results and results[0][0].pv <= 100
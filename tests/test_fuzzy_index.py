@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+from domains.fuzzy_index import FuzzyIndex, trigrams
+
+CHASSIS = ['Atlas', 'Awesome', 'Warhammer', 'King Crab', 'Locust', 'Archer', 'Dire Wolf', 'Hunchback', 'Annihilator']
+
+
+def _index(count: int = 400) -> FuzzyIndex:
+    rng = random.Random(0)
+    index = FuzzyIndex()
+    for unit_id in range(count):
+        index.add(f'unit:{unit_id}', f'{rng.choice(CHASSIS)} {rng.choice("ABKRW")}{rng.choice("HKLS")}-{unit_id}')
+    return index
+
+
+def _reference_scores(index: FuzzyIndex, query: str, limit: int) -> list[tuple[float, int]]:
+    grams = trigrams(query, complete=False)
+    hits = Counter()
+    for gram in grams:
+        hits.update(index._grams.get(gram, set()))
+    threshold = max(hits.values()) - 1
+
+    scores = []
+    for key, count in hits.items():
+        if count >= threshold:
+            title = index._lowered[key]
+            bonus = 1.0 if title.startswith(query) else 0.5 if query in title else 0.0
+            scores.append((count / len(grams) + bonus, -len(title)))
+    return sorted(scores, reverse=True)[:limit]
+
+
+def test_short_query_prefers_title_prefix():
+    index = _index()
+    index.add('faction:1', 'Aa')
+
+    results = index.search('a', limit=5)
+
+    assert results[0][0] == 'faction:1'
+    assert all(title.lower().startswith('a') for _, title, _ in results)
+
+
+def test_typo_search_matches_full_hit_count():
+    index = _index()
+
+    for query in ['warhamer', 'atlsa', 'king crb', 'hunchbak kl', 'awsome', 'dire wolf wk']:
+        results = index.search(query, limit=10)
+        grams = trigrams(query, complete=False)
+        scores = []
+        for key, title, _ in results:
+            title = title.lower()
+            bonus = 1.0 if title.startswith(query) else 0.5 if query in title else 0.0
+            scores.append((len(grams & trigrams(title)) / len(grams) + bonus, -len(title)))
+        assert scores == _reference_scores(index, query, 10)
+
+
+def test_removed_entries_are_not_found():
+    index = _index(50)
+    for unit_id in range(0, 50, 2):
+        index.remove(f'unit:{unit_id}')
+    index.add('unit:1', 'Atlas Renamed')
+
+    found = {key for key, _, _ in index.search('a', limit=100)}
+    assert found and all(int(key.split(':')[1]) % 2 for key in found)
+    assert index.search('atlas renamed', limit=1)[0][0] == 'unit:1'
+    assert len(index._sorted) == len(index)
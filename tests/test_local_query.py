@@ -0,0 +1,70 @@
+import pytest
+
+from domains.local_query import apply_filters, changed_filters, mv_key, narrows, sort_units
+
+
+@pytest.mark.parametrize('base, filters', [
+    ({}, {'title': 'atl'}),
+    ({'title': 'atl'}, {'title': 'atlas'}),
+    ({'title': 'Atl'}, {'title': 'ATLAS'}),
+    ({'pv': 20, 'pv_mode': 'gte'}, {'pv': 30, 'pv_mode': 'gte'}),
+    ({'pv': 20, 'pv_mode': 'gte'}, {'pv': 20, 'pv_mode': 'gt'}),
+    ({'pv': 40, 'pv_mode': 'lte'}, {'pv': 25, 'pv_mode': 'eq'}),
+    ({'pv': 40, 'pv_mode': 'lt'}, {'pv': 39, 'pv_mode': 'lte'}),
+    ({'specials': 'CASE, ENE', 'specials_mode': 'or'}, {'specials': 'CASE', 'specials_mode': 'or'}),
+    ({'specials': 'CASE', 'specials_mode': 'and'}, {'specials': 'CASE, ENE', 'specials_mode': 'and'}),
+    ({'role': 'Scout'}, {'role': 'Scout', 'armor': 3, 'armor_mode': 'gt'}),
+    ({'mv': '8"'}, {'mv': '8"', 'title': 'loc'}),
+])
+def test_narrows(base, filters):
+    assert narrows(base, filters)
+
+
+@pytest.mark.parametrize('base, filters', [
+    ({'title': 'atlas'}, {'title': 'atl'}),
+    ({'title': 'atl'}, {}),
+    ({'pv': 30, 'pv_mode': 'gte'}, {'pv': 20, 'pv_mode': 'gte'}),
+    ({'pv': 20, 'pv_mode': 'gt'}, {'pv': 20, 'pv_mode': 'gte'}),
+    ({'pv': 20, 'pv_mode': 'gte'}, {'pv': 30, 'pv_mode': 'lte'}),
+    ({'pv': 25}, {'pv': 26}),
+    ({'specials': 'CASE', 'specials_mode': 'or'}, {'specials': 'CASE, ENE', 'specials_mode': 'or'}),
+    ({'specials': 'CASE, ENE', 'specials_mode': 'and'}, {'specials': 'CASE', 'specials_mode': 'and'}),
+    ({'specials': 'CASE', 'specials_mode': 'or'}, {'specials': 'CASE', 'specials_mode': 'and'}),
+    ({'role': 'Scout'}, {'role': 'Sniper'}),
+    ({}, {'mv': '8"'}),
+    ({'mv': '8"'}, {'mv': '10"'}),
+])
+def test_does_not_narrow(base, filters):
+    assert not narrows(base, filters)
+
+
+def test_changed_filters_tracks_modes():
+    assert changed_filters({'pv': 20, 'pv_mode': 'gte'}, {'pv': 20, 'pv_mode': 'gt'}) == ['pv']
+    assert changed_filters({'title': 'a', 'pv': 20}, {'title': 'a', 'pv': 20}) == []
+
+
+def test_mv_key_orders_by_movement():
+    values = ['16"', '10"/8"j', '4"', '12"', '6"j', '8"', '10"']
+    assert sorted(values, key=mv_key) == ['4"', '6"j', '8"', '10"', '10"/8"j', '12"', '16"']
+
+
+def test_sort_units_is_stable_over_keys(make_unit):
+    units = [
+        make_unit(1, title='B', pv=20),
+        make_unit(2, title='A', pv=30),
+        make_unit(3, title='A', pv=20),
+    ]
+    result = sort_units(units, [('pv', 'desc'), ('title', 'asc')])
+    assert [unit.unit_id for unit in result] == [2, 3, 1]
+
+
+def test_apply_filters_matches_server_semantics(make_unit):
+    units = [
+        make_unit(1, title='Atlas', pv=40, specials='CASE, ENE'),
+        make_unit(2, title='Atlas II', pv=50, specials='ENE'),
+        make_unit(3, title='Locust', pv=15, specials='CASE'),
+    ]
+    assert [u.unit_id for u in apply_filters(units, {}, {'title': 'atl'})] == [1, 2]
+    assert [u.unit_id for u in apply_filters(units, {}, {'pv': 40, 'pv_mode': 'gte'})] == [1, 2]
+    assert [u.unit_id for u in apply_filters(units, {}, {'specials': 'case', 'specials_mode': 'or'})] == [1, 3]
+    assert [u.unit_id for u in apply_filters(units, {}, {'specials': 'CASE, ENE', 'specials_mode': 'and'})] == [1]
@@ -0,0 +1,57 @@
+import pytest
+
+from domains.local_query import apply_filters
+from domains.specials import SpecialsIndex, special_terms, split_specials
+
+
+def test_split_specials_keeps_nested_commas():
+    assert split_specials('if1, ART-LTC-2,AC2/2/-, TUR(2/2/-, IF1), C3M,') == [
+        'IF1', 'ART-LTC-2', 'AC2/2/-', 'TUR(2/2/-, IF1)', 'C3M'
+    ]
+    assert split_specials('') == []
+
+
+@pytest.mark.parametrize('token, terms', [
+    ('IF1', {'IF1', 'IF'}),
+    ('ART-LTC-2', {'ART-LTC-2', 'ART-LTC'}),
+    ('AC2/2/-', {'AC2/2/-', 'AC'}),
+    ('TUR(2/2/-, IF1)', {'TUR(2/2/-, IF1)', 'TUR', '2/2/-', 'IF1', 'IF'}),
+    ('C3M', {'C3M'}),
+    ('case', {'CASE'}),
+])
+def test_special_terms(token, terms):
+    assert special_terms(token) == terms
+
+
+def test_matching_uses_substrings_like_the_server(make_unit):
+    units = [
+        make_unit(1, specials='CASE, ENE'),
+        make_unit(2, specials='CASEII, IF1'),
+        make_unit(3, specials='TUR(2/2/-, IF1), C3M'),
+        make_unit(4, specials=''),
+    ]
+    index = SpecialsIndex()
+
+    assert index.matching(units, ['case']) == {1, 2}
+    assert index.matching(units, ['IF1', 'ENE']) == {1, 2, 3}
+    assert index.matching(units, ['IF', 'CASE'], 'and') == {2}
+    assert index.matching(units, ['TUR(2'], 'and') == {3}
+    assert index.matching(units, ['ECM']) == set()
+    assert index.matching(units, ['IF', 'ECM'], 'and') == set()
+
+
+def test_apply_filters_agrees_with_substring_scan(make_unit):
+    specials = ['CASE', 'CASEII', 'IF1', 'ART-LTC-2', 'AC2/2/-', 'TUR(2/2/-, IF1)', 'C3M', 'C3S', 'ENE']
+    units = [
+        make_unit(unit_id, specials=', '.join(specials[unit_id % 9:unit_id % 9 + unit_id % 4]))
+        for unit_id in range(60)
+    ]
+
+    for terms, mode in [('case', 'or'), ('C3, ENE', 'or'), ('IF, AC', 'and'), ('CASEII, IF1', 'and')]:
+        check = all if mode == 'and' else any
+        expected = [
+            unit.unit_id for unit in units
+            if check(term.strip().lower() in unit.specials.lower() for term in terms.split(','))
+        ]
+        found = apply_filters(units, {}, {'specials': terms, 'specials_mode': mode})
+        assert [unit.unit_id for unit in found] == expected
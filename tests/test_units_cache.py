@@ -0,0 +1,65 @@
+from domains.units_cache import UnitsCache, UnitsQuery
+from domains.units_page import UnitsPage
+
+
+def _query(**kwargs) -> UnitsQuery:
+    return UnitsQuery(era_id=1, faction_ids=(1, 2), sort_by='title', sort_order='asc', **kwargs)
+
+
+def _fill(cache, query, units, page_size, pages=None):
+    count = -(-len(units) // page_size)
+    for page in pages or range(1, count + 1):
+        start = (page - 1) * page_size
+        cache.put_page(query, UnitsPage(
+            items=units[start:start + page_size],
+            page=page,
+            pages=count,
+            size=page_size,
+            total=len(units)
+        ))
+
+
+def test_pages_reused_across_page_sizes(make_unit):
+    units = [make_unit(i, title=f'U{i:03}') for i in range(50)]
+    cache, query = UnitsCache(), _query()
+    _fill(cache, query, units, 20, pages=[1, 2])
+
+    assert cache.get_page(query, 4, 10) == (units[30:40], 4, 5)
+    assert cache.get_page(query, 2, 15) == (units[15:30], 2, 4)
+    assert cache.get_page(query, 3, 15) is None
+    assert cache.get_page(query, 1, 100) is None
+
+    _fill(cache, query, units, 20, pages=[3])
+    assert cache.get_page(query, 1, 100) == (units, 1, 1)
+    assert cache.get_page(query, 5, 10) == (units[40:50], 5, 5)
+    assert cache.get_page(query, 6, 10) is None
+
+
+def test_find_local_narrows_complete_result(make_unit):
+    units = [make_unit(i, title=f'{"Atlas" if i % 2 else "Locust"} {i:02}', pv=10 + i) for i in range(30)]
+    cache, base = UnitsCache(), _query()
+    _fill(cache, base, units, 10)
+
+    query = _query(filters={'title': 'atlas'})
+    result, page, pages = cache.find_local(query, 1, 10)
+    assert [unit.title for unit in result] == [unit.title for unit in units if 'Atlas' in unit.title][:10]
+    assert (page, pages) == (1, 2)
+
+    resorted = UnitsQuery(era_id=1, faction_ids=(2, 1), sort_by='pv', sort_order='desc', filters={'title': 'atlas'})
+    result, _, _ = cache.find_local(resorted, 1, 100)
+    assert [unit.pv for unit in result] == sorted((u.pv for u in units if 'Atlas' in u.title), reverse=True)
+
+
+def test_find_local_refuses_incomplete_or_widening(make_unit):
+    units = [make_unit(i) for i in range(30)]
+    cache = UnitsCache()
+
+    partial = _query()
+    _fill(cache, partial, units, 10, pages=[1, 2])
+    assert cache.find_local(_query(filters={'title': 'unit'}), 1, 10) is None
+
+    narrow = _query(filters={'pv': 20, 'pv_mode': 'gte'})
+    _fill(cache, narrow, units, 10)
+    assert cache.find_local(_query(filters={'pv': 10, 'pv_mode': 'gte'}), 1, 10) is None
+    assert cache.find_local(_query(filters={'pv': 20, 'pv_mode': 'gte', 'mv': '8"'}), 1, 10) is None
+    assert cache.find_local(_query(filters={'pv': 25, 'pv_mode': 'gte'}), 1, 10) is not None